@@ -65,23 +65,54 @@ Integration Notes:
 """
 
 import argparse
+import io
 import json
 import logging
 import math
-from dataclasses import dataclass, field
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Any, Callable, TypeAlias
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageFilter
-from noise import pnoise2
+import PIL
+from PIL import Image, ImageFilter
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional, the NumPy implementation is used instead
+    njit = None
+
+try:
+    import simplejpeg
+except ImportError:  # simplejpeg is optional, Pillow encodes JPEG instead
+    simplejpeg = None
+
+try:
+    import pyvips
+except (ImportError, OSError):  # pyvips (or libvips) is optional, Pillow encodes PNG
+    pyvips = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard json module is used instead
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so both are caught alike
+json_loads: Callable[[str], Any] = orjson.loads if orjson is not None else json.loads
 
 # Configure logging
 logger: logging.Logger = logging.getLogger(__name__)
 
 # Type definitions
 ColorTuple: TypeAlias = tuple[int, int, int] | tuple[int, int, int, int]
+Palette: TypeAlias = list[ColorTuple] | np.ndarray
 NoiseFunction: Callable[[float, float], float]
+ImageEncoder: TypeAlias = Callable[[Image.Image], bytes]
 TextureArray: np.ndarray
 
 # Standard resolution presets
@@ -95,8 +126,24 @@ STANDARD_RESOLUTIONS: dict[str, tuple[int, int]] = {
     "8k": (16384, 8192),
 }
 
+# Pillow-SIMD (a drop-in Pillow fork with SIMD resampling) uses .postN versions
+PILLOW_SIMD: bool = ".post" in PIL.__version__
+
+# Minimum grid size (pixels) before NumPy fBm is split across processes
+PARALLEL_MIN_PIXELS: int = 1 << 21
+
+# Minimum grid size (pixels) before the 'auto' device moves fBm to the GPU,
+# i.e. the "1k" preset (2048x1024) and larger
+GPU_MIN_PIXELS: int = 2048 * 1024
+
+# Context rows around each pole strip when blurring it
+POLE_BLUR_MARGIN: int = 8
+
+# Texture buffers above this size are backed by a temporary file
+MEMMAP_MIN_BYTES: int = 256 << 20
+
 # Predefined color palettes for all texture types
-PREDEFINED_PALETTES: dict[str, list[ColorTuple]] = {
+_PALETTE_COLORS: dict[str, list[ColorTuple]] = {
     "jupiter": [(255, 165, 0), (204, 85, 0), (153, 101, 21), (111, 78, 55)],
     "neptune": [(173, 216, 230), (0, 255, 255), (0, 0, 139), (106, 90, 205)],
     "saturn": [(153, 50, 204), (128, 0, 128), (230, 230, 250), (221, 160, 221)],
@@ -112,8 +159,673 @@ PREDEFINED_PALETTES: dict[str, list[ColorTuple]] = {
     "marble_emerald": [(240, 255, 240), (0, 100, 0)],
 }
 
+# Predefined palettes, converted once at import to read-only (N, 3) uint8 arrays
+PREDEFINED_PALETTES: dict[str, np.ndarray] = {
+    name: np.array(colors, dtype=np.uint8) for name, colors in _PALETTE_COLORS.items()
+}
+for _palette in PREDEFINED_PALETTES.values():
+    _palette.flags.writeable = False
+
+# Noise fields are quantized to uint8, so float32 precision is sufficient
+NOISE_DTYPE: type = np.float32
+
+# Gradient directions used by the vectorized Perlin noise
+_GRADIENTS_X: np.ndarray = np.array([1, -1, 1, -1, 1, -1, 0, 0], dtype=NOISE_DTYPE)
+_GRADIENTS_Y: np.ndarray = np.array([1, 1, -1, -1, 0, 0, 1, -1], dtype=NOISE_DTYPE)
+
+
+@lru_cache(maxsize=16)
+def _permutation_table(seed: int) -> np.ndarray:
+    """Build the Perlin permutation table for a seed.
+
+    Tables are cached per seed and returned read-only, so repeated
+    generations with the same seed in one process reuse them.
+
+    Args:
+        seed: Random seed for the permutation.
+
+    Returns:
+        Shuffled permutation of 0..255 as uint8, repeated twice (512 entries)
+        so that lattice hashes never need a second wrap-around mask.
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    perm: np.ndarray = rng.permutation(256).astype(np.uint8)
+    table: np.ndarray = np.concatenate([perm, perm])
+    table.flags.writeable = False
+    return table
+
+
+def _perlin_2d(x: np.ndarray, y: np.ndarray, perm: np.ndarray) -> np.ndarray:
+    """Evaluate 2D Perlin noise over whole coordinate arrays.
+
+    Lattice hashing, quintic fades and gradient dot products are computed
+    with NumPy operations on the full arrays instead of per-pixel calls.
+
+    Args:
+        x: First noise coordinate array.
+        y: Second noise coordinate array (same shape as x).
+        perm: Permutation table from _permutation_table().
+
+    Returns:
+        Noise values roughly in [-1, 1], same shape as x.
+    """
+    x_floor: np.ndarray = np.floor(x)
+    y_floor: np.ndarray = np.floor(y)
+    xi: np.ndarray = x_floor.astype(np.int32) & 255
+    yi: np.ndarray = y_floor.astype(np.int32) & 255
+    xf: np.ndarray = x - x_floor
+    yf: np.ndarray = y - y_floor
+
+    # Quintic fade curves: 6t^5 - 15t^4 + 10t^3
+    u: np.ndarray = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+    v: np.ndarray = yf * yf * yf * (yf * (yf * 6 - 15) + 10)
+
+    # Hash the four lattice corners (perm has 512 entries, no extra mask)
+    px0: np.ndarray = perm[xi]
+    px1: np.ndarray = perm[xi + 1]
+    h00: np.ndarray = perm[px0 + yi] & 7
+    h10: np.ndarray = perm[px1 + yi] & 7
+    h01: np.ndarray = perm[px0 + yi + 1] & 7
+    h11: np.ndarray = perm[px1 + yi + 1] & 7
+
+    # Gradient dot products at each corner
+    n00: np.ndarray = _GRADIENTS_X[h00] * xf + _GRADIENTS_Y[h00] * yf
+    n10: np.ndarray = _GRADIENTS_X[h10] * (xf - 1) + _GRADIENTS_Y[h10] * yf
+    n01: np.ndarray = _GRADIENTS_X[h01] * xf + _GRADIENTS_Y[h01] * (yf - 1)
+    n11: np.ndarray = _GRADIENTS_X[h11] * (xf - 1) + _GRADIENTS_Y[h11] * (yf - 1)
+
+    nx0: np.ndarray = n00 + u * (n10 - n00)
+    nx1: np.ndarray = n01 + u * (n11 - n01)
+    return nx0 + v * (nx1 - nx0)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _perlin_point(x: float, y: float, perm: np.ndarray) -> float:
+        """Evaluate 2D Perlin noise at a single point (Numba kernel).
+
+        Works in NOISE_DTYPE with the operation order of _perlin_2d(), and
+        without fastmath, so a seed gives the same noise with or without
+        Numba.
+
+        Args:
+            x: First noise coordinate, as NOISE_DTYPE.
+            y: Second noise coordinate, as NOISE_DTYPE.
+            perm: Permutation table from _permutation_table().
+
+        Returns:
+            Noise value roughly in [-1, 1], as NOISE_DTYPE.
+        """
+        # Typed constants: mixing float32 with Python numbers gives float64
+        one = NOISE_DTYPE(1)
+        six = NOISE_DTYPE(6)
+        ten = NOISE_DTYPE(10)
+        fifteen = NOISE_DTYPE(15)
+
+        x_floor: float = NOISE_DTYPE(math.floor(x))
+        y_floor: float = NOISE_DTYPE(math.floor(y))
+        xi: int = int(x_floor) & 255
+        yi: int = int(y_floor) & 255
+        xf: float = x - x_floor
+        yf: float = y - y_floor
+        u: float = xf * xf * xf * (xf * (xf * six - fifteen) + ten)
+        v: float = yf * yf * yf * (yf * (yf * six - fifteen) + ten)
+
+        px0: int = perm[xi]
+        px1: int = perm[xi + 1]
+        h00: int = perm[px0 + yi] & 7
+        h10: int = perm[px1 + yi] & 7
+        h01: int = perm[px0 + yi + 1] & 7
+        h11: int = perm[px1 + yi + 1] & 7
+
+        n00: float = _GRADIENTS_X[h00] * xf + _GRADIENTS_Y[h00] * yf
+        n10: float = _GRADIENTS_X[h10] * (xf - one) + _GRADIENTS_Y[h10] * yf
+        n01: float = _GRADIENTS_X[h01] * xf + _GRADIENTS_Y[h01] * (yf - one)
+        n11: float = _GRADIENTS_X[h11] * (xf - one) + _GRADIENTS_Y[h11] * (yf - one)
+
+        nx0: float = n00 + u * (n10 - n00)
+        nx1: float = n01 + u * (n11 - n01)
+        return nx0 + v * (nx1 - nx0)
+
+    @njit(parallel=True, cache=True)
+    def _fbm_kernel(
+        out: np.ndarray,
+        coord1: np.ndarray,
+        coord2: np.ndarray,
+        perm: np.ndarray,
+        frequencies: np.ndarray,
+        amplitudes: np.ndarray,
+        absolute: bool,
+    ) -> None:
+        """Accumulate all fBm octaves per pixel in one pass (Numba kernel).
+
+        Rows are distributed across cores and every pixel is written once,
+        so no per-octave temporary arrays are allocated.
+
+        Args:
+            out: Output array receiving the noise values.
+            coord1: First noise coordinate grid.
+            coord2: Second noise coordinate grid.
+            perm: Permutation table from _permutation_table().
+            frequencies: Frequency of each octave from _octave_tables().
+            amplitudes: Amplitude of each octave from _octave_tables().
+            absolute: Accumulate absolute noise values (turbulence).
+        """
+        height, width = out.shape
+        for y in prange(height):
+            for x in range(width):
+                out[y, x] = _fbm_point(
+                    coord1[y, x], coord2[y, x], perm, frequencies, amplitudes, absolute
+                )
+
+    @njit(cache=True)
+    def _fbm_point(
+        c1: float,
+        c2: float,
+        perm: np.ndarray,
+        frequencies: np.ndarray,
+        amplitudes: np.ndarray,
+        absolute: bool,
+    ) -> float:
+        """Accumulate all fBm octaves at a single point (Numba kernel).
+
+        Octave frequencies and amplitudes are rounded to NOISE_DTYPE before
+        use, as _fbm_numpy() does when it multiplies arrays by them.
+
+        Args:
+            c1: First noise coordinate, as NOISE_DTYPE.
+            c2: Second noise coordinate, as NOISE_DTYPE.
+            perm: Permutation table from _permutation_table().
+            frequencies: Frequency of each octave from _octave_tables().
+            amplitudes: Amplitude of each octave from _octave_tables().
+            absolute: Accumulate absolute noise values (turbulence).
+
+        Returns:
+            Accumulated noise value, as NOISE_DTYPE.
+        """
+        total: float = NOISE_DTYPE(0)
+        for octave in range(frequencies.shape[0]):
+            freq: float = NOISE_DTYPE(frequencies[octave])
+            value: float = _perlin_point(c1 * freq, c2 * freq, perm)
+            if absolute:
+                value = abs(value)
+            total += value * NOISE_DTYPE(amplitudes[octave])
+        return total
+
+    @njit(parallel=True, cache=True)
+    def _earth_kernel(
+        out: np.ndarray,
+        lut: np.ndarray,
+        lat_trig: np.ndarray,
+        lon_trig: np.ndarray,
+        detail_lat_trig: np.ndarray,
+        detail_lon_trig: np.ndarray,
+        xz_mode: bool,
+        perm: np.ndarray,
+        frequencies: np.ndarray,
+        amplitudes: np.ndarray,
+        detail_frequencies: np.ndarray,
+        detail_amplitudes: np.ndarray,
+    ) -> None:
+        """Generate the Earth-like texture in a single pass (Numba kernel).
+
+        Height, terrain color and detail variation are computed per pixel
+        and only the final uint8 color is stored, instead of streaming
+        several full-size intermediate arrays through memory. The float32
+        rounding steps of the array implementation are reproduced, so both
+        give the same texture.
+
+        Args:
+            out: uint8 output texture of shape (H, W, 3).
+            lut: 256-entry terrain color lookup table.
+            lat_trig: (cos, sin) of the latitude axis, shape (2, H).
+            lon_trig: (cos, sin) of the longitude axis, shape (2, W).
+            detail_lat_trig: (cos, sin) of the detail latitude axis.
+            detail_lon_trig: (cos, sin) of the detail longitude axis.
+            xz_mode: Use the 'xz' noise coordinate mode.
+            perm: Permutation table from _permutation_table().
+            frequencies: Height octave frequencies from _octave_tables().
+            amplitudes: Height octave amplitudes from _octave_tables().
+            detail_frequencies: Detail octave frequencies.
+            detail_amplitudes: Detail octave amplitudes.
+        """
+        height, width = out.shape[:2]
+        for y in prange(height):
+            for x in range(width):
+                # Terrain height, normalized to [0, 1] and quantized
+                c1: float = lat_trig[0, y] * lon_trig[0, x]
+                c2: float = (
+                    lat_trig[1, y] if xz_mode else lat_trig[0, y] * lon_trig[1, x]
+                )
+                value: float = np.float32(
+                    _fbm_point(c1, c2, perm, frequencies, amplitudes, False)
+                )
+                value = np.float32(np.float32(value + 1.0) * 0.5)
+                value = np.float32(min(max(value, 0.0), 1.0) * 256)
+                index: int = int(min(value, 255.0))
+
+                # Detail variation
+                c1 = detail_lat_trig[0, y] * detail_lon_trig[0, x]
+                c2 = (
+                    detail_lat_trig[1, y]
+                    if xz_mode
+                    else detail_lat_trig[0, y] * detail_lon_trig[1, x]
+                )
+                detail: float = np.float32(
+                    _fbm_point(
+                        c1, c2, perm, detail_frequencies, detail_amplitudes, False
+                    )
+                )
+                variation: int = int(np.float32(np.float32(detail / 1.5) * 30))
+
+                for channel in range(3):
+                    color: int = lut[index, channel] + variation
+                    out[y, x, channel] = max(0, min(color, 255))
+
+    @njit(parallel=True, cache=True)
+    def _projection_kernel(
+        plane_y: np.ndarray,
+        plane_x: np.ndarray,
+        theta: np.ndarray,
+        phi: np.ndarray,
+        source_height: int,
+        source_width: int,
+    ) -> None:
+        """Compute the source pixel of every equirectangular pixel (Numba kernel).
+
+        Works from the 1D angle axes, so no full-size coordinate grids or
+        trigonometric temporaries are materialized.
+
+        Args:
+            plane_y: Output source rows, shape (len(phi), len(theta)).
+            plane_x: Output source columns, shape (len(phi), len(theta)).
+            theta: Longitude of each output column in radians.
+            phi: Polar angle of each output row in radians.
+            source_height: Height of the source image.
+            source_width: Width of the source image.
+        """
+        # Angle-to-pixel factors, multiplied instead of dividing per pixel
+        row_scale: float = source_height / math.pi
+        column_scale: float = source_width / (2 * math.pi)
+        for y in prange(plane_y.shape[0]):
+            sin_phi: float = math.sin(phi[y])
+            sphere_y: float = math.cos(phi[y])
+            row: int = int(math.acos(sphere_y) * row_scale)
+            row = max(0, min(row, source_height - 1))
+            for x in range(plane_y.shape[1]):
+                sphere_x: float = sin_phi * math.cos(theta[x])
+                sphere_z: float = sin_phi * math.sin(theta[x])
+                column: int = int(
+                    (math.atan2(sphere_z, sphere_x) + math.pi) * column_scale
+                )
+                plane_y[y, x] = row
+                plane_x[y, x] = max(0, min(column, source_width - 1))
+
+
+@lru_cache(maxsize=16)
+def _octave_tables(
+    octaves: int, frequency: float, persistence: float, lacunarity: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build the per-octave frequency and amplitude tables of an fBm sum.
+
+    Args:
+        octaves: Number of noise octaves.
+        frequency: Frequency of the first octave.
+        persistence: Amplitude multiplier between octaves.
+        lacunarity: Frequency multiplier between octaves.
+
+    Returns:
+        Read-only (frequencies, amplitudes) arrays of length octaves.
+    """
+    powers: np.ndarray = np.arange(octaves)
+    frequencies: np.ndarray = frequency * lacunarity**powers
+    amplitudes: np.ndarray = persistence ** powers.astype(float)
+    frequencies.flags.writeable = False
+    amplitudes.flags.writeable = False
+    return frequencies, amplitudes
+
+
+def _fbm_numpy(
+    coord1: np.ndarray,
+    coord2: np.ndarray,
+    perm: np.ndarray,
+    frequencies: np.ndarray,
+    amplitudes: np.ndarray,
+    absolute: bool,
+) -> np.ndarray:
+    """Accumulate fBm octaves with NumPy array operations.
+
+    Args:
+        coord1: First noise coordinate grid.
+        coord2: Second noise coordinate grid.
+        perm: Permutation table from _permutation_table().
+        frequencies: Frequency of each octave from _octave_tables().
+        amplitudes: Amplitude of each octave from _octave_tables().
+        absolute: Accumulate absolute noise values (turbulence).
+
+    Returns:
+        Accumulated noise values, same shape as coord1.
+    """
+    total: np.ndarray = np.zeros(np.shape(coord1), dtype=NOISE_DTYPE)
+    # Scaled coordinates are written into scratch buffers reused by all octaves
+    x: np.ndarray = np.empty_like(total)
+    y: np.ndarray = np.empty_like(total)
+
+    for frequency, amplitude in zip(frequencies.tolist(), amplitudes.tolist()):
+        np.multiply(coord1, frequency, out=x)
+        np.multiply(coord2, frequency, out=y)
+        octave: np.ndarray = _perlin_2d(x, y, perm)
+        if absolute:
+            np.abs(octave, out=octave)
+        octave *= amplitude
+        total += octave
+
+    return total
+
+
+def _fbm_band(
+    shm_name: str,
+    shape: tuple[int, int],
+    rows: tuple[int, int],
+    coord1: np.ndarray,
+    coord2: np.ndarray,
+    *fbm_args: Any,
+) -> None:
+    """Compute fBm for a band of rows into a shared memory block (worker).
+
+    Args:
+        shm_name: Name of the shared memory block holding the output grid.
+        shape: Shape of the full output grid.
+        rows: (start, stop) rows of the band.
+        coord1: First noise coordinate grid for the band.
+        coord2: Second noise coordinate grid for the band.
+        *fbm_args: Remaining arguments forwarded to _fbm_numpy().
+    """
+    shm: shared_memory.SharedMemory = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out: np.ndarray = np.ndarray(shape, dtype=NOISE_DTYPE, buffer=shm.buf)
+        out[rows[0] : rows[1]] = _fbm_numpy(coord1, coord2, *fbm_args)
+        del out
+    finally:
+        shm.close()
+
+
+@lru_cache(maxsize=1)
+def _process_pool() -> ProcessPoolExecutor:
+    """Get the process pool used by parallel NumPy fBm.
+
+    Created on first use and reused by every later call, so worker start-up
+    is paid once per run instead of once per noise field.
+
+    Returns:
+        Process pool with one worker per CPU.
+    """
+    return ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+def _fbm_parallel(coord1: np.ndarray, coord2: np.ndarray, *fbm_args: Any) -> np.ndarray:
+    """Split NumPy fBm into row bands computed by a process pool.
+
+    Each worker writes its band into one shared memory block, so results
+    are not pickled back to the parent process.
+
+    Args:
+        coord1: First noise coordinate grid.
+        coord2: Second noise coordinate grid.
+        *fbm_args: Remaining arguments forwarded to _fbm_numpy().
+
+    Returns:
+        Accumulated noise values, same shape as coord1.
+    """
+    height: int = coord1.shape[0]
+    workers: int = min(os.cpu_count() or 1, height)
+    bounds: list[int] = np.linspace(0, height, workers + 1).astype(int).tolist()
+    shm: shared_memory.SharedMemory = shared_memory.SharedMemory(
+        create=True, size=coord1.size * np.dtype(NOISE_DTYPE).itemsize
+    )
+    try:
+        executor: ProcessPoolExecutor = _process_pool()
+        futures = [
+            executor.submit(
+                _fbm_band,
+                shm.name,
+                coord1.shape,
+                (start, stop),
+                coord1[start:stop],
+                coord2[start:stop],
+                *fbm_args,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+        result: np.ndarray = np.ndarray(
+            coord1.shape, dtype=NOISE_DTYPE, buffer=shm.buf
+        ).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+
+@lru_cache(maxsize=1)
+def cuda_available() -> bool:
+    """Check whether PyTorch with a CUDA device is available.
+
+    Returns:
+        True if noise can be computed on a CUDA device.
+    """
+    try:
+        import torch
+    except ImportError:
+        return False
+    return bool(torch.cuda.is_available())
+
+
+def gpu_selected(device: str, pixels: int) -> bool:
+    """Check whether noise for a grid should be computed on the GPU.
+
+    Args:
+        device: Compute device ('cpu', 'cuda' or 'auto').
+        pixels: Number of grid points.
+
+    Returns:
+        True if CUDA is available and requested, or 'auto' and the grid has
+        at least GPU_MIN_PIXELS points.
+    """
+    if device == "cpu" or (device == "auto" and pixels < GPU_MIN_PIXELS):
+        return False
+    return cuda_available()
+
+
+def _fbm_torch(
+    coord1: np.ndarray,
+    coord2: np.ndarray,
+    perm: np.ndarray,
+    frequencies: np.ndarray,
+    amplitudes: np.ndarray,
+    absolute: bool,
+    device: str = "cuda",
+) -> np.ndarray:
+    """Accumulate fBm octaves with PyTorch tensors on a GPU.
+
+    Mirrors _perlin_2d() so the same coordinates produce the same noise
+    pattern as the CPU implementations (up to float32 precision).
+
+    Args:
+        coord1: First noise coordinate grid.
+        coord2: Second noise coordinate grid.
+        perm: Permutation table from _permutation_table().
+        frequencies: Frequency of each octave from _octave_tables().
+        amplitudes: Amplitude of each octave from _octave_tables().
+        absolute: Accumulate absolute noise values (turbulence).
+        device: PyTorch device to run on.
+
+    Returns:
+        Accumulated noise values, same shape as coord1.
+    """
+    import torch
+
+    def to_device(array: np.ndarray, dtype: Any) -> Any:
+        return torch.from_numpy(np.ascontiguousarray(array)).to(device, dtype)
+
+    c1 = to_device(coord1, torch.float32)
+    c2 = to_device(coord2, torch.float32)
+    perm_t = torch.tensor(perm, dtype=torch.int64, device=device)
+    grad_x = to_device(_GRADIENTS_X, torch.float32)
+    grad_y = to_device(_GRADIENTS_Y, torch.float32)
+    total = torch.zeros_like(c1)
+
+    for frequency, amplitude in zip(frequencies.tolist(), amplitudes.tolist()):
+        x = c1 * frequency
+        y = c2 * frequency
+        x_int = torch.floor(x)
+        y_int = torch.floor(y)
+        xf = x - x_int
+        yf = y - y_int
+        xi = x_int.to(torch.int64) & 255
+        yi = y_int.to(torch.int64) & 255
+        u = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+        v = yf * yf * yf * (yf * (yf * 6 - 15) + 10)
+
+        px0 = perm_t[xi]
+        px1 = perm_t[xi + 1]
+        h00 = perm_t[px0 + yi] & 7
+        h10 = perm_t[px1 + yi] & 7
+        h01 = perm_t[px0 + yi + 1] & 7
+        h11 = perm_t[px1 + yi + 1] & 7
+
+        n00 = grad_x[h00] * xf + grad_y[h00] * yf
+        n10 = grad_x[h10] * (xf - 1) + grad_y[h10] * yf
+        n01 = grad_x[h01] * xf + grad_y[h01] * (yf - 1)
+        n11 = grad_x[h11] * (xf - 1) + grad_y[h11] * (yf - 1)
+        nx0 = n00 + u * (n10 - n00)
+        nx1 = n01 + u * (n11 - n01)
+        value = nx0 + v * (nx1 - nx0)
+        if absolute:
+            value = value.abs()
+        total += value * amplitude
+
+    return total.cpu().numpy()
+
+
+def perlin_fbm_2d(
+    coord1: np.ndarray,
+    coord2: np.ndarray,
+    octaves: int,
+    frequency: float,
+    seed: int,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+    absolute: bool = False,
+    device: str = "cpu",
+) -> np.ndarray:
+    """Compute fractal Brownian motion (fBm) over whole coordinate grids.
+
+    Runs on the GPU with PyTorch when device is 'cuda' (or 'auto' for grids
+    of at least GPU_MIN_PIXELS) and CUDA is available. On the CPU, uses the
+    parallel Numba kernel when Numba is installed, otherwise evaluates each
+    octave with NumPy array operations, split into row bands across
+    processes for large grids.
+
+    Args:
+        coord1: First noise coordinate grid.
+        coord2: Second noise coordinate grid.
+        octaves: Number of noise octaves.
+        frequency: Frequency of the first octave.
+        seed: Random seed for the permutation table.
+        persistence: Amplitude multiplier between octaves.
+        lacunarity: Frequency multiplier between octaves.
+        absolute: Accumulate absolute noise values (turbulence).
+        device: Compute device ('cpu', 'cuda' or 'auto').
+
+    Returns:
+        Accumulated noise values, same shape as coord1.
+    """
+    perm: np.ndarray = _permutation_table(seed)
+    frequencies, amplitudes = _octave_tables(
+        octaves, frequency, persistence, lacunarity
+    )
+    if gpu_selected(device, np.size(coord1)):
+        return _fbm_torch(coord1, coord2, perm, frequencies, amplitudes, absolute)
+    # Both CPU backends scale NOISE_DTYPE coordinates, so they agree
+    coord1 = np.asarray(coord1, dtype=NOISE_DTYPE)
+    coord2 = np.asarray(coord2, dtype=NOISE_DTYPE)
+    if njit is not None:
+        out: np.ndarray = np.empty(np.shape(coord1), dtype=NOISE_DTYPE)
+        _fbm_kernel(
+            out,
+            np.ascontiguousarray(coord1),
+            np.ascontiguousarray(coord2),
+            perm,
+            frequencies,
+            amplitudes,
+            absolute,
+        )
+        return out
+
+    fbm_args: tuple[Any, ...] = (perm, frequencies, amplitudes, absolute)
+    if (
+        np.ndim(coord1) == 2
+        and np.size(coord1) >= PARALLEL_MIN_PIXELS
+        and (os.cpu_count() or 1) > 1
+    ):
+        return _fbm_parallel(coord1, coord2, *fbm_args)
+    return _fbm_numpy(coord1, coord2, *fbm_args)
+
+
+def _make_encoder(image_format: str, quality: int) -> ImageEncoder:
+    """Build the function that encodes images for an output format.
+
+    The backend is chosen once: simplejpeg for JPEG and libvips for PNG when
+    those packages are installed, Pillow otherwise.
+
+    Args:
+        image_format: Output image format (PNG or JPEG).
+        quality: JPEG quality (1-100) if the format is JPEG.
+
+    Returns:
+        Function encoding an image into the bytes of the output file.
+    """
+    image_format = image_format.upper()
+
+    if image_format == "JPEG" and simplejpeg is not None:
+
+        def encode_simplejpeg(image: Image.Image) -> bytes:
+            rgb: np.ndarray = np.ascontiguousarray(image.convert("RGB"))
+            return simplejpeg.encode_jpeg(
+                rgb, quality=quality, colorspace="RGB", colorsubsampling="420"
+            )
+
+        return encode_simplejpeg
+
+    if image_format == "PNG" and pyvips is not None:
+
+        def encode_pyvips(image: Image.Image) -> bytes:
+            rgb_image: Image.Image = image.convert("RGB")
+            return pyvips.Image.new_from_memory(
+                rgb_image.tobytes(), rgb_image.width, rgb_image.height, 3, "uchar"
+            ).pngsave_buffer()
+
+        return encode_pyvips
+
+    save_kwargs: dict[str, Any] = {}
+    if image_format == "JPEG":
+        save_kwargs["quality"] = quality
+        save_kwargs["optimize"] = True
+        # 4:2:0 chroma subsampling, as with simplejpeg above
+        save_kwargs["subsampling"] = 2
+
+    def encode_pillow(image: Image.Image) -> bytes:
+        buffer: io.BytesIO = io.BytesIO()
+        image.save(buffer, format=image_format, **save_kwargs)
+        return buffer.getvalue()
+
+    return encode_pillow
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TextureConfig:
     """Configuration for texture generation.
 
@@ -123,6 +835,8 @@ class TextureConfig:
         output_path: Path to save the generated texture.
         format: Output image format (PNG or JPEG).
         quality: JPEG quality (1-100) if the format is JPEG.
+        encoder: Function encoding an image in the configured format, bound
+            once after initialization.
     """
 
     width: int = 2048
@@ -130,12 +844,15 @@ class TextureConfig:
     output_path: Path = field(default_factory=lambda: Path("output.png"))
     format: str = "PNG"
     quality: int = 95
+    encoder: ImageEncoder = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate configuration after initialization."""
+        """Validate configuration and bind the encoder after initialization."""
         if self.width <= 0 or self.height <= 0:
             raise ValueError("Width and height must be positive")
 
+        object.__setattr__(self, "encoder", _make_encoder(self.format, self.quality))
+
         if self.width != 2 * self.height:
             logger.warning(
                 f"Non-standard aspect ratio {self.width}:{self.height}. "
@@ -143,7 +860,7 @@ class TextureConfig:
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NoiseConfig:
     """Configuration for procedural noise generation.
 
@@ -154,6 +871,7 @@ class NoiseConfig:
         scale: Noise scale factor.
         seed: Random seed for noise generation.
         coordinate_mode: Coordinate system for noise ('xy' or 'xz').
+        device: Compute device for noise ('cpu', 'cuda' or 'auto').
     """
 
     octaves: int = 6
@@ -162,6 +880,7 @@ class NoiseConfig:
     scale: float = 100.0
     seed: int = 42
     coordinate_mode: str = "xy"
+    device: str = "auto"
 
     def __post_init__(self) -> None:
         """Validate noise parameters."""
@@ -173,6 +892,8 @@ class NoiseConfig:
             raise ValueError("Scale must be positive")
         if self.coordinate_mode not in ("xy", "xz"):
             raise ValueError("Coordinate mode must be 'xy' or 'xz'")
+        if self.device not in ("cpu", "cuda", "auto"):
+            raise ValueError("Device must be 'cpu', 'cuda' or 'auto'")
 
 
 class EquirectangularConverter:
@@ -189,15 +910,23 @@ class EquirectangularConverter:
         self.y_coords: np.ndarray
         self.theta_grid: np.ndarray
         self.phi_grid: np.ndarray
+        # Gather indices per source (height, width), reused across conversions
+        self._index_cache: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
         self._setup_coordinate_mappings()
 
     def _setup_coordinate_mappings(self) -> None:
         """Pre-calculate coordinate mappings for performance."""
-        self.x_coords = np.linspace(0, 2 * np.pi, self.config.width, endpoint=False)
-        self.y_coords = np.linspace(0, np.pi, self.config.height, endpoint=True)
+        self.x_coords = np.linspace(
+            0, 2 * np.pi, self.config.width, endpoint=False, dtype=NOISE_DTYPE
+        )
+        self.y_coords = np.linspace(
+            0, np.pi, self.config.height, endpoint=True, dtype=NOISE_DTYPE
+        )
 
-        # Create meshgrid for vectorized operations
-        self.theta_grid, self.phi_grid = np.meshgrid(self.x_coords, self.y_coords)
+        # Create meshgrid views for vectorized operations (no full-size copies)
+        self.theta_grid, self.phi_grid = np.meshgrid(
+            self.x_coords, self.y_coords, copy=False
+        )
 
     def convert_image_to_equirectangular(self, input_path: Path) -> Image.Image:
         """Convert flat image to equirectangular projection.
@@ -221,6 +950,8 @@ class EquirectangularConverter:
             raise ValueError(f"Cannot load image {input_path}: {e}") from e
 
         logger.info(f"Converting {input_path} to equirectangular format")
+        if PILLOW_SIMD:
+            logger.info(f"Using Pillow-SIMD {PIL.__version__} for resampling")
 
         # Resize the source to square for easier spherical mapping
         size: int = min(source_img.size)
@@ -236,35 +967,64 @@ class EquirectangularConverter:
         Returns:
             Projected image in equirectangular format.
         """
-        result_array: TextureArray = np.zeros(
-            (self.config.height, self.config.width, 3), dtype=np.uint8
-        )
         source_array: np.ndarray = np.array(source_img)
-        source_height, source_width = source_array.shape[:2]
-
-        for y in range(self.config.height):
-            for x in range(self.config.width):
-                # Convert to spherical coordinates
-                theta: float = float(self.theta_grid[y, x].item())
-                phi: float = float(self.phi_grid[y, x].item())
-                # Convert to 3D coordinates on a unit sphere
-                sphere_x: float = math.sin(phi) * math.cos(theta)
-                sphere_y: float = math.cos(phi)
-                sphere_z: float = math.sin(phi) * math.sin(theta)
-                # Project to plane coordinates
-                plane_x: int = int(
-                    (math.atan2(sphere_z, sphere_x) + math.pi)
-                    / (2 * math.pi)
-                    * source_width
-                )
-                plane_y: int = int((math.acos(sphere_y) / math.pi) * source_height)
-                # Ensure coordinates are within bounds
-                plane_x = max(0, min(plane_x, source_width - 1))
-                plane_y = max(0, min(plane_y, source_height - 1))
-                result_array[y, x] = source_array[plane_y, plane_x]
+        plane_y, plane_x = self._projection_indices(*source_array.shape[:2])
 
+        # Gather every output pixel from the source in one pass
+        result_array: TextureArray = source_array[plane_y, plane_x]
         return Image.fromarray(result_array)
 
+    def _projection_indices(
+        self, source_height: int, source_width: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the source row and column of every output pixel.
+
+        The indices only depend on the output and source shapes, so they are
+        computed once per source shape and cached.
+
+        Args:
+            source_height: Height of the source image.
+            source_width: Width of the source image.
+
+        Returns:
+            Tuple of (plane_y, plane_x) int32 arrays of shape (H, W).
+        """
+        key: tuple[int, int] = (source_height, source_width)
+        if key in self._index_cache:
+            return self._index_cache[key]
+
+        if njit is not None:
+            plane_y: np.ndarray = np.empty(self.theta_grid.shape, dtype=np.int32)
+            plane_x: np.ndarray = np.empty(self.theta_grid.shape, dtype=np.int32)
+            _projection_kernel(
+                plane_y,
+                plane_x,
+                self.x_coords,
+                self.y_coords,
+                source_height,
+                source_width,
+            )
+            self._index_cache[key] = plane_y, plane_x
+            return plane_y, plane_x
+
+        # Convert to 3D coordinates on a unit sphere
+        sin_phi: np.ndarray = np.sin(self.phi_grid)
+        sphere_x: np.ndarray = sin_phi * np.cos(self.theta_grid)
+        sphere_y: np.ndarray = np.cos(self.phi_grid)
+        sphere_z: np.ndarray = sin_phi * np.sin(self.theta_grid)
+
+        # Project to plane coordinates
+        plane_x = (
+            (np.arctan2(sphere_z, sphere_x) + np.pi) * (source_width / (2 * np.pi))
+        ).astype(np.int32)
+        plane_y = (np.arccos(sphere_y) * (source_height / np.pi)).astype(np.int32)
+
+        # Ensure coordinates are within bounds
+        np.clip(plane_x, 0, source_width - 1, out=plane_x)
+        np.clip(plane_y, 0, source_height - 1, out=plane_y)
+        self._index_cache[key] = plane_y, plane_x
+        return plane_y, plane_x
+
 
 class ProceduralTextureGenerator:
     """Generate procedural textures suitable for sphere mapping."""
@@ -279,35 +1039,120 @@ class ProceduralTextureGenerator:
         self.config: TextureConfig = config
         self.noise_config: NoiseConfig = noise_config
         np.random.seed(noise_config.seed)
+        # Angle axes, built once and shared by every generator
+        self.lon: np.ndarray
+        self.lat: np.ndarray
+        self.lon, self.lat = self._lon_lat_axes()
+        self._axis_trig: dict[float, tuple[np.ndarray, ...]] = {}
+        if noise_config.device == "cuda" and not cuda_available():
+            logger.warning("CUDA is not available, computing noise on the CPU")
+
+    @staticmethod
+    def _apply_color_variation(colors: np.ndarray, variation: np.ndarray) -> None:
+        """Apply per-pixel variation to a color field in place, clamping to 0..255.
+
+        Args:
+            colors: uint8 color field of shape (H, W, 3), modified in place.
+            variation: int16 variation field of shape (H, W).
+        """
+        # Saturating add: widen to int16 only for the sum, clamp in place
+        varied: np.ndarray = np.add(colors, variation[..., np.newaxis], dtype=np.int16)
+        np.clip(varied, 0, 255, out=varied)
+        np.copyto(colors, varied, casting="unsafe")
 
     @staticmethod
-    def _apply_color_variation(base_color: ColorTuple, variation: int) -> ColorTuple:
-        """Apply variation to a color tuple, clamping values between 0 and 255.
+    def _palette_array(colors: Palette) -> np.ndarray:
+        """Convert colors to an RGB palette array.
 
         Args:
-            base_color: Input RGB or RGBA color tuple.
-            variation: Variation to apply to each color component.
+            colors: List of RGB or RGBA color tuples, or an (N, 3|4) array.
 
         Returns:
-            Color tuple with variation applied (RGB or RGBA).
+            Palette of shape (N, 3) uint8 with the RGB components.
 
         Raises:
-            ValueError: If base_color has invalid length.
+            ValueError: If a color has invalid length.
         """
-        if len(base_color) not in (3, 4):
-            raise ValueError("Color tuple must have 3 or 4 components")
-        if len(base_color) == 3:
-            return (
-                max(0, min(255, base_color[0] + variation)),
-                max(0, min(255, base_color[1] + variation)),
-                max(0, min(255, base_color[2] + variation)),
-            )
-        return (
-            max(0, min(255, base_color[0] + variation)),
-            max(0, min(255, base_color[1] + variation)),
-            max(0, min(255, base_color[2] + variation)),
-            max(0, min(255, base_color[3] + variation)),
+        if isinstance(colors, np.ndarray):
+            if colors.ndim != 2 or colors.shape[1] not in (3, 4):
+                raise ValueError("Color tuples must have 3 or 4 components")
+            return colors[:, :3].astype(np.uint8, copy=False)
+        for color in colors:
+            if len(color) not in (3, 4):
+                raise ValueError("Color tuples must have 3 or 4 components")
+        return np.array([color[:3] for color in colors], dtype=np.uint8)
+
+    @staticmethod
+    def _quantize_unit_field(field: np.ndarray) -> np.ndarray:
+        """Quantize values in [0, 1] to uint8 lookup-table indices.
+
+        The field is scaled in place and clamped straight into the uint8
+        output, so no intermediate float array is allocated.
+
+        Args:
+            field: Float array of values between 0 and 1, modified in place.
+
+        Returns:
+            Array of indices between 0 and 255, same shape as field.
+        """
+        indices: np.ndarray = np.empty(field.shape, dtype=np.uint8)
+        np.multiply(field, 256, out=field)
+        np.minimum(field, 255, out=indices, casting="unsafe")
+        return indices
+
+    def _lookup_texture(self, lut: np.ndarray, field: np.ndarray) -> np.ndarray:
+        """Map a [0, 1] field to colors through a 256-entry lookup table.
+
+        Args:
+            lut: Color lookup table of shape (256, 3) uint8.
+            field: Float array of values between 0 and 1, modified in place.
+
+        Returns:
+            uint8 texture of shape (H, W, 3).
+        """
+        texture_array: TextureArray = self._empty_texture()
+        # uint8 indices cannot leave the table, and mode="clip" lets take()
+        # skip bounds checks and write straight into the output buffer
+        np.take(
+            lut,
+            self._quantize_unit_field(field),
+            axis=0,
+            out=texture_array,
+            mode="clip",
         )
+        return texture_array
+
+    def _empty_texture(self) -> np.ndarray:
+        """Allocate the uint8 RGB buffer a texture is written into.
+
+        Large buffers are memory-mapped onto an unlinked temporary file, so
+        their pages can be written back and evicted by the OS instead of
+        adding to the process's anonymous memory alongside the PIL copy.
+
+        Returns:
+            Uninitialized array of shape (H, W, 3).
+        """
+        shape: tuple[int, int, int] = (self.config.height, self.config.width, 3)
+        if math.prod(shape) <= MEMMAP_MIN_BYTES:
+            return np.empty(shape, dtype=np.uint8)
+
+        # The mapping stays valid once the backing file is closed and removed
+        with tempfile.TemporaryFile() as backing_file:
+            return np.memmap(backing_file, dtype=np.uint8, mode="w+", shape=shape)
+
+    def _lon_lat_axes(self) -> tuple[np.ndarray, np.ndarray]:
+        """Build the longitude and latitude axes of the texture.
+
+        Returns:
+            Tuple of (lon, lat) in radians, of shapes (W,) and (H,).
+        """
+        lon: np.ndarray = np.arange(self.config.width, dtype=NOISE_DTYPE) * NOISE_DTYPE(
+            2 * np.pi / self.config.width
+        )
+        lat: np.ndarray = np.arange(
+            self.config.height, dtype=NOISE_DTYPE
+        ) * NOISE_DTYPE(np.pi / self.config.height)
+        return lon, lat
 
     def generate_earth_like_texture(
         self,
@@ -329,34 +1174,64 @@ class ProceduralTextureGenerator:
             ValueError: If color tuples have invalid lengths.
         """
         logger.info("Generating Earth-like procedural texture")
-        texture_array: TextureArray = np.zeros(
-            (self.config.height, self.config.width, 3), dtype=np.uint8
+        palette: np.ndarray = self._palette_array(
+            [ocean_color, land_color, mountain_color]
         )
 
-        for color in (ocean_color, land_color, mountain_color):
-            if len(color) not in (3, 4):
-                raise ValueError("Color tuples must have 3 or 4 components")
+        # 256-entry lookup table: 0 ocean, 1 land, 2 mountain
+        lut: np.ndarray = palette[np.digitize(np.arange(256) / 256, (0.3, 0.6))]
+        if njit is not None and not gpu_selected(
+            self.noise_config.device, self.config.width * self.config.height
+        ):
+            return Image.fromarray(self._generate_earth_fused(lut))
 
-        for y in range(self.config.height):
-            for x in range(self.config.width):
-                lon: float = (x / self.config.width) * 2 * math.pi
-                lat: float = (y / self.config.height) * math.pi
-                height: float = self._generate_height_value(lon, lat)
-                color: ColorTuple
-                if height < 0.3:
-                    color = ocean_color
-                elif height < 0.6:
-                    color = land_color
-                else:
-                    color = mountain_color
-                variation: int = int(self._generate_noise_value(lon * 4, lat * 4) * 30)
-                final_color: ColorTuple = self._apply_color_variation(color, variation)
-                texture_array[y, x] = final_color[:3]
+        height: np.ndarray = self._generate_height_field()
+        variation: np.ndarray = (self._generate_noise_field(angle_scale=4) * 30).astype(
+            np.int16
+        )
+        texture_array: TextureArray = self._lookup_texture(lut, height)
+        self._apply_color_variation(texture_array, variation)
 
         return Image.fromarray(texture_array)
 
+    def _generate_earth_fused(self, lut: np.ndarray) -> np.ndarray:
+        """Generate the Earth-like texture with the fused Numba kernel.
+
+        Args:
+            lut: 256-entry terrain color lookup table.
+
+        Returns:
+            uint8 texture of shape (H, W, 3).
+        """
+        noise_config: NoiseConfig = self.noise_config
+        frequencies, amplitudes = _octave_tables(
+            noise_config.octaves,
+            noise_config.scale,
+            noise_config.persistence,
+            noise_config.lacunarity,
+        )
+        detail_frequencies, detail_amplitudes = _octave_tables(2, 1.0, 0.5, 2.0)
+        cos_lat, sin_lat, cos_lon, sin_lon = self._get_axis_trig(1)
+        detail_trig: tuple[np.ndarray, ...] = self._get_axis_trig(4)
+        texture_array: TextureArray = self._empty_texture()
+        _earth_kernel(
+            texture_array,
+            lut,
+            np.stack((cos_lat, sin_lat)),
+            np.stack((cos_lon, sin_lon)),
+            np.stack(detail_trig[:2]),
+            np.stack(detail_trig[2:]),
+            noise_config.coordinate_mode == "xz",
+            _permutation_table(noise_config.seed),
+            frequencies,
+            amplitudes,
+            detail_frequencies,
+            detail_amplitudes,
+        )
+        return texture_array
+
     def generate_gas_giant_texture(
-        self, base_colors: list[ColorTuple] | None = None
+        self, base_colors: Palette | None = None
     ) -> Image.Image:
         """Generate gas giant style texture with bands and swirls.
 
@@ -377,32 +1252,24 @@ class ProceduralTextureGenerator:
                 (160, 82, 45),  # Saddle brown
             ]
 
-        if not base_colors:
+        if len(base_colors) == 0:
             raise ValueError("base_colors cannot be empty")
-        for color in base_colors:
-            if len(color) not in (3, 4):
-                raise ValueError("Color tuples must have 3 or 4 components")
+        palette: np.ndarray = self._palette_array(base_colors)
 
         logger.info("Generating gas giant procedural texture")
-        texture_array: TextureArray = np.zeros(
-            (self.config.height, self.config.width, 3), dtype=np.uint8
+        # Bands depend on latitude only: one cached sin(lat * 6) per row
+        band_column: np.ndarray = self._get_axis_trig(6)[1] * 0.5 + 0.5
+        band_factor: np.ndarray = self._generate_turbulence_field()
+        band_factor *= 0.3
+        band_factor += band_column[:, np.newaxis]
+        np.remainder(band_factor, 1.0, out=band_factor)
+        # 256-entry lookup table mapping quantized band factors to bands
+        lut: np.ndarray = palette[np.arange(256) * len(palette) // 256]
+        variation: np.ndarray = (self._generate_noise_field(angle_scale=2) * 40).astype(
+            np.int16
         )
-
-        for y in range(self.config.height):
-            for x in range(self.config.width):
-                lon: float = (x / self.config.width) * 2 * math.pi
-                lat: float = (y / self.config.height) * math.pi
-                band_factor: float = math.sin(lat * 6) * 0.5 + 0.5
-                turbulence: float = self._generate_turbulence(lon, lat)
-                band_factor = (band_factor + turbulence * 0.3) % 1.0
-                color_index: int = int(band_factor * len(base_colors))
-                color_index = max(0, min(color_index, len(base_colors) - 1))
-                base_color: ColorTuple = base_colors[color_index]
-                variation: int = int(self._generate_noise_value(lon * 2, lat * 2) * 40)
-                final_color: ColorTuple = self._apply_color_variation(
-                    base_color, variation
-                )
-                texture_array[y, x] = final_color[:3]
+        texture_array: TextureArray = self._lookup_texture(lut, band_factor)
+        self._apply_color_variation(texture_array, variation)
 
         return Image.fromarray(texture_array)
 
@@ -424,135 +1291,136 @@ class ProceduralTextureGenerator:
             ValueError: If base_color or vein_color have invalid lengths.
         """
         logger.info("Generating marble procedural texture")
-        texture_array: TextureArray = np.zeros(
-            (self.config.height, self.config.width, 3), dtype=np.uint8
-        )
+        palette: np.ndarray = self._palette_array([base_color, vein_color])
 
-        for color in (base_color, vein_color):
-            if len(color) not in (3, 4):
-                raise ValueError("Color tuples must have 3 or 4 components")
+        base, vein = palette.astype(NOISE_DTYPE)
 
-        for y in range(self.config.height):
-            for x in range(self.config.width):
-                lon: float = (x / self.config.width) * 2 * math.pi
-                lat: float = (y / self.config.height) * math.pi
-                marble_value: float = (
-                    math.sin(
-                        (lon + lat) * (self.noise_config.scale / 25.0)
-                        + self._generate_turbulence(lon, lat) * 3
-                    )
-                    * 0.5
-                    + 0.5
-                )
-                final_color: ColorTuple = (
-                    int(
-                        base_color[0] * (1 - marble_value)
-                        + vein_color[0] * marble_value
-                    ),
-                    int(
-                        base_color[1] * (1 - marble_value)
-                        + vein_color[1] * marble_value
-                    ),
-                    int(
-                        base_color[2] * (1 - marble_value)
-                        + vein_color[2] * marble_value
-                    ),
-                )
-                texture_array[y, x] = final_color
+        # marble = sin(diagonal + 3 * turbulence) * 0.5 + 0.5, built in place
+        marble_value: np.ndarray = self._generate_turbulence_field()
+        marble_value *= 3
+        marble_value += (self.lon[np.newaxis, :] + self.lat[:, np.newaxis]) * (
+            self.noise_config.scale / 25.0
+        )
+        np.sin(marble_value, out=marble_value)
+        marble_value *= 0.5
+        marble_value += 0.5
+        marble_value = marble_value[..., np.newaxis]
+
+        # Blend base and vein colors: base * (1 - marble) + vein * marble
+        blend: np.ndarray = vein * marble_value
+        np.subtract(1, marble_value, out=marble_value)
+        blend += base * marble_value
+        texture_array: TextureArray = self._empty_texture()
+        np.copyto(texture_array, blend, casting="unsafe")
 
         return Image.fromarray(texture_array)
 
-    def _generate_height_value(self, lon: float, lat: float) -> float:
-        """Generate height value using Perlin noise.
+    def _generate_height_field(self) -> np.ndarray:
+        """Generate height values using fractal Perlin noise.
+
+        Returns:
+            Normalized height values between 0 and 1.
+        """
+        coord1, coord2 = self._get_noise_coordinates()
+        height: np.ndarray = perlin_fbm_2d(
+            coord1,
+            coord2,
+            octaves=self.noise_config.octaves,
+            frequency=self.noise_config.scale,
+            seed=self.noise_config.seed,
+            persistence=self.noise_config.persistence,
+            lacunarity=self.noise_config.lacunarity,
+            device=self.noise_config.device,
+        )
+        # Rescale in place: the fBm result is a fresh array owned here
+        height += 1.0
+        height *= 0.5
+        return np.clip(height, 0.0, 1.0, out=height)
+
+    def _generate_noise_field(self, angle_scale: float = 1.0) -> np.ndarray:
+        """Generate simple two-octave noise values.
 
         Args:
-            lon: Longitude in radians.
-            lat: Latitude in radians.
+            angle_scale: Multiplier applied to the angle axes.
 
         Returns:
-            Normalized height value between 0 and 1.
+            Noise values normalized by the total octave amplitude.
         """
-        coord1, coord2 = self._get_noise_coordinates(lon, lat)
-        height: float = 0.0
-        amplitude: float = 1.0
-        frequency: float = self.noise_config.scale
-
-        for _ in range(self.noise_config.octaves):
-            height += (
-                pnoise2(
-                    coord1 * frequency,
-                    coord2 * frequency,
-                    octaves=1,
-                    persistence=self.noise_config.persistence,
-                    lacunarity=self.noise_config.lacunarity,
-                    base=self.noise_config.seed,
-                )
-                * amplitude
-            )
-            amplitude *= self.noise_config.persistence
-            frequency *= self.noise_config.lacunarity
+        coord1, coord2 = self._get_noise_coordinates(angle_scale)
+        noise_field: np.ndarray = perlin_fbm_2d(
+            coord1,
+            coord2,
+            octaves=2,
+            frequency=1.0,
+            seed=self.noise_config.seed,
+            device=self.noise_config.device,
+        )
+        noise_field /= 1.5
+        return noise_field
 
-        return max(0.0, min(1.0, (height + 1.0) * 0.5))
+    def _get_axis_trig(self, angle_scale: float) -> tuple[np.ndarray, ...]:
+        """Get the trigonometric terms of the scaled angle axes.
 
-    def _generate_noise_value(self, lon: float, lat: float) -> float:
-        """Generate simple noise value.
+        Results are cached per scale, so repeated generations with the same
+        generator reuse them.
 
         Args:
-            lon: Longitude in radians.
-            lat: Latitude in radians.
+            angle_scale: Multiplier applied to the angle axes.
 
         Returns:
-            Noise value.
+            Tuple of (cos_lat, sin_lat, cos_lon, sin_lon) 1D arrays.
         """
-        coord1, coord2 = self._get_noise_coordinates(lon, lat)
-        return pnoise2(coord1, coord2, octaves=2, base=self.noise_config.seed)
+        if angle_scale not in self._axis_trig:
+            lon: np.ndarray = self.lon * NOISE_DTYPE(angle_scale)
+            lat: np.ndarray = self.lat * NOISE_DTYPE(angle_scale)
+            self._axis_trig[angle_scale] = (
+                np.cos(lat),
+                np.sin(lat),
+                np.cos(lon),
+                np.sin(lon),
+            )
+        return self._axis_trig[angle_scale]
 
-    def _get_noise_coordinates(self, lon: float, lat: float) -> tuple[float, float]:
+    def _get_noise_coordinates(
+        self, angle_scale: float = 1.0
+    ) -> tuple[np.ndarray, np.ndarray]:
         """Convert spherical coordinates to noise coordinates based on mode.
 
+        Longitude only enters through its cosine and sine, so the noise wraps
+        around the sphere without a seam. The trigonometric terms are computed
+        once per row and per column and broadcast to the full grid.
+
         Args:
-            lon: Longitude in radians.
-            lat: Latitude in radians.
+            angle_scale: Multiplier applied to the angle axes.
 
         Returns:
-            Tuple of (coord1, coord2) for noise generation, based on coordinate_mode
-            ('xy' or 'xz').
+            Tuple of (coord1, coord2) grids of shape (H, W) for noise
+            generation, based on coordinate_mode ('xy' or 'xz').
         """
-        x: float = math.cos(lat) * math.cos(lon)
-        y: float = math.cos(lat) * math.sin(lon)
-        z: float = math.sin(lat)
-        return (x, z) if self.noise_config.coordinate_mode == "xz" else (x, y)
+        cos_lat, sin_lat, cos_lon, sin_lon = self._get_axis_trig(angle_scale)
+        coord1: np.ndarray = cos_lat[:, np.newaxis] * cos_lon
+        if self.noise_config.coordinate_mode == "xz":
+            return coord1, np.broadcast_to(sin_lat[:, np.newaxis], coord1.shape)
+        return coord1, cos_lat[:, np.newaxis] * sin_lon
 
-    def _generate_turbulence(self, lon: float, lat: float) -> float:
-        """Generate turbulence value using configured noise parameters.
-
-        Args:
-            lon: Longitude in radians.
-            lat: Latitude in radians.
+    def _generate_turbulence_field(self) -> np.ndarray:
+        """Generate turbulence values using configured noise parameters.
 
         Returns:
-            Turbulence value.
+            Turbulence values.
         """
-        coord1, coord2 = self._get_noise_coordinates(lon, lat)
-        turbulence: float = 0.0
-        freq: float = self.noise_config.scale / 100.0
-        amplitude: float = 1.0
-
-        for _ in range(self.noise_config.octaves):
-            turbulence += (
-                abs(
-                    pnoise2(
-                        coord1 * freq,
-                        coord2 * freq,
-                        base=self.noise_config.seed + 100,
-                    )
-                )
-                * amplitude
-            )
-            freq *= self.noise_config.lacunarity
-            amplitude *= self.noise_config.persistence
-
-        return turbulence
+        coord1, coord2 = self._get_noise_coordinates()
+        return perlin_fbm_2d(
+            coord1,
+            coord2,
+            octaves=self.noise_config.octaves,
+            frequency=self.noise_config.scale / 100.0,
+            seed=self.noise_config.seed + 100,
+            persistence=self.noise_config.persistence,
+            lacunarity=self.noise_config.lacunarity,
+            device=self.noise_config.device,
+            absolute=True,
+        )
 
 
 class TextureOptimizer:
@@ -571,28 +1439,59 @@ class TextureOptimizer:
         logger.info("Applying pole distortion fix")
         # Uniformize top and bottom rows to reduce polar distortion
         img_array: np.ndarray = np.array(image)
-        for x in range(img_array.shape[1]):
-            if x > 0:
-                img_array[0, x] = img_array[0, 0]
-                img_array[-1, x] = img_array[-1, 0]
+        img_array[0, 1:] = img_array[0, 0]
+        img_array[-1, 1:] = img_array[-1, 0]
 
-        result: Image.Image = Image.fromarray(img_array)
+        # Create gradient mask for poles, fading from 255 at the edge rows
+        height: int = img_array.shape[0]
+        pole_height: int = height // 10
+        if pole_height == 0:
+            return Image.fromarray(img_array)
+        alpha: np.ndarray = (255 * (1 - np.arange(pole_height) / pole_height)).astype(
+            np.uint8
+        )
 
-        # Apply slight gaussian blur to poles
-        mask: Image.Image = Image.new("L", result.size, 0)
-        draw: ImageDraw.Draw = ImageDraw.Draw(mask)
+        # Apply slight gaussian blur to the pole strips only; both are
+        # blended from the unmodified rows before being written back
+        top: np.ndarray = TextureOptimizer._blur_strip(img_array, 0, pole_height, alpha)
+        bottom: np.ndarray = TextureOptimizer._blur_strip(
+            img_array, height - pole_height, height, alpha[::-1]
+        )
+        img_array[:pole_height] = top
+        img_array[height - pole_height :] = bottom
+        return Image.fromarray(img_array)
 
-        # Create gradient mask for poles
-        height: int = result.size[1]
-        pole_height: int = height // 10
+    @staticmethod
+    def _blur_strip(
+        img_array: np.ndarray, start: int, stop: int, alpha: np.ndarray
+    ) -> np.ndarray:
+        """Blend a blurred copy of a row strip over the original rows.
 
-        for y in range(pole_height):
-            alpha: int = int(255 * (1 - y / pole_height))
-            draw.rectangle([0, y, result.size[0], y + 1], fill=alpha)
-            draw.rectangle([0, height - y - 1, result.size[0], height - y], fill=alpha)
+        The blur only reads a few neighboring rows, so blurring the strip
+        with POLE_BLUR_MARGIN extra rows of context gives the same pixels as
+        blurring the whole image.
 
-        blurred: Image.Image = result.filter(ImageFilter.GaussianBlur(radius=1))
-        return Image.composite(blurred, result, mask)
+        Args:
+            img_array: Image array of shape (H, W, C).
+            start: First row of the strip.
+            stop: Row after the last row of the strip.
+            alpha: Blur opacity per strip row (0 to 255).
+
+        Returns:
+            Blended strip of shape (stop - start, W, C).
+        """
+        context_start: int = max(0, start - POLE_BLUR_MARGIN)
+        context_stop: int = min(img_array.shape[0], stop + POLE_BLUR_MARGIN)
+        blurred: Image.Image = Image.fromarray(
+            img_array[context_start:context_stop]
+        ).filter(ImageFilter.GaussianBlur(radius=1))
+        width: int = img_array.shape[1]
+        blurred = blurred.crop((0, start - context_start, width, stop - context_start))
+        mask: Image.Image = Image.fromarray(
+            np.repeat(alpha[:, np.newaxis], width, axis=1)
+        )
+        strip: Image.Image = Image.fromarray(img_array[start:stop])
+        return np.asarray(Image.composite(blurred, strip, mask))
 
     @staticmethod
     def optimize_for_godot(
@@ -609,14 +1508,14 @@ class TextureOptimizer:
         """
         logger.info(f"Optimizing texture for Godot ({target_format} format)")
         width, height = image.size
-        new_width: int = 2 ** math.ceil(math.log2(width))
-        new_height: int = 2 ** math.ceil(math.log2(height))
-
-        if new_width != width or new_height != height:
-            logger.info(f"Resizing to power-of-two: {new_width}x{new_height}")
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Standard resolutions are already powers of two: nothing to resize
+        if width & (width - 1) == 0 and height & (height - 1) == 0:
+            return image
 
-        return image
+        new_width: int = 1 << (width - 1).bit_length()
+        new_height: int = 1 << (height - 1).bit_length()
+        logger.info(f"Resizing to power-of-two: {new_width}x{new_height}")
+        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
 
 class SphereTextureGenerator:
@@ -665,6 +1564,66 @@ class SphereTextureGenerator:
             texture_type: Type of texture to generate ('earth', 'gas_giant', 'marble').
             **kwargs: Additional arguments for texture generation.
 
+        Raises:
+            ValueError: If the texture type is unsupported.
+        """
+        self._save_image(self._render_procedural(texture_type, **kwargs))
+
+    def generate_procedural_with_lods(
+        self, texture_type: str, lods: list[int], **kwargs: Any
+    ) -> list[Path]:
+        """Generate a procedural texture once and save smaller LOD copies.
+
+        The noise is evaluated only at the configured resolution; each LOD is
+        downsampled from it (box-filtered mip reduction for integer factors,
+        Lanczos otherwise) instead of being regenerated.
+
+        Args:
+            texture_type: Type of texture to generate ('earth', 'gas_giant', 'marble').
+            lods: Widths of the LOD copies, each smaller than the texture.
+            **kwargs: Additional arguments for texture generation.
+
+        Returns:
+            Paths of the saved LOD copies, named <stem>_<width><suffix>.
+
+        Raises:
+            ValueError: If the texture type is unsupported or a LOD width is
+                not smaller than the texture width.
+        """
+        if not all(0 < lod_width < self.config.width for lod_width in lods):
+            raise ValueError(
+                f"LOD widths must be between 1 and {self.config.width - 1}"
+            )
+        result_image: Image.Image = self._render_procedural(texture_type, **kwargs)
+        self._save_image(result_image)
+
+        width, height = result_image.size
+        output_path: Path = self.config.output_path
+        lod_paths: list[Path] = []
+        for lod_width in lods:
+            lod_height: int = max(1, lod_width * height // width)
+            factor: int = width // lod_width
+            if lod_width * factor == width and lod_height * factor == height:
+                lod_image: Image.Image = result_image.reduce(factor)
+            else:
+                lod_image = result_image.resize(
+                    (lod_width, lod_height), Image.Resampling.LANCZOS
+                )
+            lod_path: Path = output_path.with_stem(f"{output_path.stem}_{lod_width}")
+            self._save_image(lod_image, lod_path)
+            lod_paths.append(lod_path)
+        return lod_paths
+
+    def _render_procedural(self, texture_type: str, **kwargs: Any) -> Image.Image:
+        """Render a procedural texture with pole fix and Godot optimization.
+
+        Args:
+            texture_type: Type of texture to generate ('earth', 'gas_giant', 'marble').
+            **kwargs: Additional arguments for texture generation.
+
+        Returns:
+            Final texture image, ready to be saved.
+
         Raises:
             ValueError: If the texture type is unsupported.
         """
@@ -680,38 +1639,179 @@ class SphereTextureGenerator:
 
         result_image: Image.Image = generators[texture_type](**kwargs)
         result_image = TextureOptimizer.apply_pole_fix(result_image)
-        result_image = TextureOptimizer.optimize_for_godot(
-            result_image, self.config.format
-        )
-        self._save_image(result_image)
+        return TextureOptimizer.optimize_for_godot(result_image, self.config.format)
 
-    def _save_image(self, image: Image.Image) -> None:
+    def _save_image(self, image: Image.Image, path: Path | None = None) -> None:
         """Save image to the configured output path.
 
         Args:
             image: Image to save.
+            path: Destination path. Uses the configured output path if None.
 
         Raises:
             OSError: If saving fails.
         """
-        self.config.output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_kwargs: dict[str, Any] = {}
-        if self.config.format.upper() == "JPEG":
-            save_kwargs["quality"] = self.config.quality
-            save_kwargs["optimize"] = True
-
+        path = path or self.config.output_path
+        path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            image.save(
-                self.config.output_path, format=self.config.format, **save_kwargs
-            )
-            logger.info(f"Saved texture: {self.config.output_path}")
+            # Encode in memory, then write the whole file at once
+            data: bytes = self.config.encoder(image)
+            path.write_bytes(data)
+            logger.info(f"Saved texture: {path} ({len(data) // 1024}KB)")
         except Exception as e:
             raise OSError(f"Failed to save image: {e}") from e
 
 
+def config_kwargs(config_class: type, options: dict[str, Any]) -> dict[str, Any]:
+    """Select the options accepted by a configuration dataclass.
+
+    Args:
+        config_class: TextureConfig or NoiseConfig.
+        options: Mapping of option names to values (e.g. vars(args)).
+
+    Returns:
+        Keyword arguments for the config_class constructor.
+    """
+    return {
+        config_field.name: options[config_field.name]
+        for config_field in fields(config_class)
+        if config_field.init and config_field.name in options
+    }
+
+
+def parse_int_list(value: str) -> list[int]:
+    """Parse a comma-separated list of integers (seeds, LOD widths).
+
+    Args:
+        value: Command-line value such as '202,203,204'.
+
+    Returns:
+        List of integers.
+
+    Raises:
+        argparse.ArgumentTypeError: If an item is not an integer.
+    """
+    try:
+        return [int(item) for item in value.split(",") if item.strip()]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid integer list: {value}") from e
+
+
+def batch_job_argv(job: dict[str, Any]) -> list[str]:
+    """Convert one --batch job into command-line arguments for main().
+
+    Keys are long option names (dashes or underscores), values are the option
+    values: true adds a flag, false or null omits the option, lists of
+    numbers become comma-separated lists and nested lists (--base-colors)
+    are passed as JSON.
+
+    Args:
+        job: Mapping such as {"mode": "procedural", "type": "marble", "seed": 7}.
+
+    Returns:
+        Argument list such as ['--mode', 'procedural', '--type', 'marble', ...].
+    """
+    argv: list[str] = []
+    for key, value in job.items():
+        option: str = f"--{key.replace('_', '-')}"
+        if value is True:
+            argv.append(option)
+        elif value is False or value is None:
+            continue
+        elif isinstance(value, list) and any(isinstance(v, list) for v in value):
+            argv += [option, json.dumps(value)]
+        elif isinstance(value, list):
+            argv += [option, ",".join(str(v) for v in value)]
+        else:
+            argv += [option, str(value)]
+    return argv
+
+
+def _run_batch_job(argv: list[str]) -> int:
+    """Run one batch job in a worker process.
+
+    Args:
+        argv: Command-line arguments of the job.
+
+    Returns:
+        Exit code of the job; argument errors are reported, not raised.
+    """
+    try:
+        return main(argv)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+
+
+def run_batch(batch_path: Path, parser: argparse.ArgumentParser) -> int:
+    """Generate every job of a JSON batch file in parallel worker processes.
+
+    Python start-up, imports and compiled kernels are paid once per worker
+    instead of once per texture.
+
+    Args:
+        batch_path: JSON file holding a list of jobs (see batch_job_argv()).
+        parser: CLI parser, used to report invalid batch files.
+
+    Returns:
+        Exit code (0 if every job succeeded, 1 otherwise).
+    """
+    try:
+        jobs: Any = json_loads(batch_path.read_text(encoding="utf-8"))
+    except OSError as e:
+        parser.error(f"Cannot read --batch file: {e}")
+    except json.JSONDecodeError:
+        parser.error(f"Invalid JSON in --batch file: {batch_path}")
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        parser.error("--batch file must contain a list of JSON objects")
+    if not jobs:
+        return 0
+
+    # ProcessPoolExecutor workers are not daemonic, so a job may still use
+    # the process pool of the parallel NumPy fBm
+    workers: int = min(os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        exit_codes: list[int] = list(
+            executor.map(_run_batch_job, [batch_job_argv(job) for job in jobs])
+        )
+
+    failed: int = sum(1 for code in exit_codes if code != 0)
+    if failed:
+        logger.error(f"{failed} of {len(jobs)} batch jobs failed")
+        return 1
+    print(f"✅ Batch completed: {len(jobs)} jobs")
+    return 0
+
+
+def print_summary(texture_config: TextureConfig, kwargs: dict[str, Any]) -> None:
+    """Print the generation summary for one output file.
+
+    Args:
+        texture_config: Configuration the texture was generated with.
+        kwargs: Color arguments passed to the generator.
+    """
+    print("\n" + "=" * 60)
+    print("📊 Generation summary")
+    print("=" * 60)
+    print(f"✅ File saved: {texture_config.output_path}")
+    print(f"📏 Final size: {texture_config.width}x{texture_config.height}")
+    print(f"📦 Format: {texture_config.format}")
+    print(f"💾 File size: {texture_config.output_path.stat().st_size // 1024}KB")
+    if kwargs:
+        colors_summary: dict[str, Any] = {
+            key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in kwargs.items()
+        }
+        print(f"🎨 Colors: {colors_summary}")
+    print("=" * 60)
+
+
+@lru_cache(maxsize=1)
 def create_cli_parser() -> argparse.ArgumentParser:
     """Create command-line interface parser.
 
+    The parser is built once and reused, so calling main() repeatedly from a
+    batch script does not rebuild the whole argument tree each time.
+
     Returns:
         Configured argument parser.
 
@@ -786,6 +1886,9 @@ Examples:
         ((i++)); 
     done
 
+    # Generate the jobs listed in a JSON file in parallel, in a single run
+    python sphere_texture_generator.py --batch jobs.json
+
 Notes:
     - Predefined palettes: jupiter, neptune, saturn, venus, mars, mercury, uranus, 
       pluto, titan, europa, marble_classic, marble_onyx, marble_emerald
@@ -803,8 +1906,15 @@ Notes:
         "-m",
         "--mode",
         choices=["convert", "procedural"],
-        required=True,
-        help="Operation mode: convert existing image or generate procedural texture",
+        help="Operation mode: convert existing image or generate procedural texture "
+        "(required unless --batch is given)",
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        help="JSON file with a list of jobs generated in parallel worker processes; "
+        'each job maps long option names to values, e.g. {"mode": "procedural", '
+        '"type": "marble", "seed": 7, "output": "marble_7.png"}',
     )
     parser.add_argument(
         "-i",
@@ -819,6 +1929,11 @@ Notes:
         default=Path("sphere_texture.png"),
         help="Output file path",
     )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Do nothing if the output file already exists",
+    )
     resolution_group: argparse._ArgumentGroup = parser.add_mutually_exclusive_group()
     resolution_group.add_argument(
         "-r",
@@ -872,6 +1987,18 @@ Notes:
         default=42,
         help="Random seed",
     )
+    parser.add_argument(
+        "--seeds",
+        type=parse_int_list,
+        help="Comma-separated seeds to generate in one run (e.g. 202,203,204); "
+        "each output gets a _seed<N> suffix",
+    )
+    parser.add_argument(
+        "--lods",
+        type=parse_int_list,
+        help="Comma-separated widths of smaller LOD copies (e.g. 1024,512), "
+        "downsampled from the full texture; each gets a _<width> suffix",
+    )
     parser.add_argument(
         "-c",
         "--scale",
@@ -902,13 +2029,24 @@ Notes:
         default="xy",
         help="Noise coordinate mode: 'xy' uses x,y; 'xz' uses x,z",
     )
+    parser.add_argument(
+        "--device",
+        choices=["cpu", "cuda", "auto"],
+        default="auto",
+        help="Compute device for procedural noise; 'auto' uses CUDA for 2048x1024 "
+        "and larger textures when available (cuda requires PyTorch)",
+    )
 
     return parser
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main application entry point.
 
+    Args:
+        argv: Command-line arguments to parse. Uses sys.argv[1:] if None, so
+            other scripts can call main() directly with their own arguments.
+
     Returns:
         Exit code (0 for success, 1 for error).
 
@@ -917,11 +2055,35 @@ def main() -> int:
         OSError: If file operations fail.
     """
     parser: argparse.ArgumentParser = create_cli_parser()
-    args: argparse.Namespace = parser.parse_args()
+    args: argparse.Namespace = parser.parse_args(argv)
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if args.batch:
+        return run_batch(args.batch, parser)
+    if not args.mode:
+        parser.error("the following arguments are required: -m/--mode")
+
+    # One (seed, output path) job per requested seed
+    jobs: list[tuple[int, Path]] = [(args.seed, args.output)]
+    if args.seeds:
+        if args.mode != "procedural":
+            parser.error("--seeds is only valid in procedural mode")
+        jobs = [
+            (seed, args.output.with_stem(f"{args.output.stem}_seed{seed}"))
+            for seed in args.seeds
+        ]
+
+    if args.skip_existing:
+        for _, output_path in jobs:
+            if output_path.exists():
+                logger.info(f"Output exists, skipping: {output_path}")
+                print(f"⏭️  Skipped existing file: {output_path}")
+        jobs = [job for job in jobs if not job[1].exists()]
+        if not jobs:
+            return 0
+
     try:
         # Determine resolution
         width: int
@@ -935,51 +2097,58 @@ def main() -> int:
             width, height = 2048, 1024
 
         # Create configuration
+        options: dict[str, Any] = vars(args) | {
+            "width": width,
+            "height": height,
+            "output_path": args.output,
+        }
         texture_config: TextureConfig = TextureConfig(
-            width=width,
-            height=height,
-            output_path=args.output,
-            format=args.format,
-            quality=args.quality,
-        )
-
-        noise_config: NoiseConfig = NoiseConfig(
-            octaves=args.octaves,
-            seed=args.seed,
-            scale=args.scale,
-            coordinate_mode=args.coordinate_mode,
+            **config_kwargs(TextureConfig, options)
         )
+        noise_config: NoiseConfig = NoiseConfig(**config_kwargs(NoiseConfig, options))
 
         # Parse base_colors
         kwargs: dict[str, Any] = {}
         if args.mode == "procedural" and args.base_colors:
-            colors: list[ColorTuple]
+            colors: Palette
             if args.base_colors in PREDEFINED_PALETTES:
                 colors = PREDEFINED_PALETTES[args.base_colors]
             else:
                 try:
-                    parsed_colors: Any = json.loads(args.base_colors)
+                    parsed_colors: Any = json_loads(args.base_colors)
                     if not isinstance(parsed_colors, list):
                         raise ValueError(
                             "base-colors JSON must be a list of RGB tuples"
                         )
-                    colors: list[ColorTuple] = []
-                    for color in parsed_colors:
-                        if not isinstance(color, list) or len(color) not in (3, 4):
-                            raise ValueError(
-                                "Each color must be a list of "
-                                "3 or 4 integers (RGB/RGBA)"
-                            )
-                        if not all(isinstance(c, int) and 0 <= c <= 255 for c in color):
-                            raise ValueError(
-                                "RGB values must be integers between 0 and 255"
-                            )
-                        if len(color) == 3:
-                            r, g, b = color
-                            colors.append((r, g, b))
-                        else:  # len(color) == 4
-                            r, g, b, a = color
-                            colors.append((r, g, b, a))
+                    if not all(
+                        isinstance(color, list) and len(color) in (3, 4)
+                        for color in parsed_colors
+                    ):
+                        raise ValueError(
+                            "Each color must be a list of 3 or 4 integers (RGB/RGBA)"
+                        )
+                    # Pad RGB colors mixed with RGBA ones to opaque RGBA, so
+                    # the palette is still a single array
+                    if len({len(color) for color in parsed_colors}) > 1:
+                        parsed_colors = [
+                            color + [255] * (4 - len(color)) for color in parsed_colors
+                        ]
+                    try:
+                        color_array: np.ndarray = np.asarray(parsed_colors)
+                    except ValueError as e:
+                        raise ValueError(
+                            "RGB values must be integers between 0 and 255"
+                        ) from e
+                    if color_array.size and (
+                        color_array.ndim != 2
+                        or color_array.dtype.kind not in "iub"
+                        or (color_array < 0).any()
+                        or (color_array > 255).any()
+                    ):
+                        raise ValueError(
+                            "RGB values must be integers between 0 and 255"
+                        )
+                    colors = color_array.astype(np.uint8)
                 except json.JSONDecodeError:
                     parser.error(f"Invalid JSON for --base-colors: {args.base_colors}")
                 except ValueError as e:
@@ -1004,32 +2173,35 @@ def main() -> int:
                     parser.error("gas_giant requires at least 2 colors")
                 kwargs = {"base_colors": colors}
 
-        # Create generator
-        generator: SphereTextureGenerator = SphereTextureGenerator(
-            texture_config, noise_config
-        )
+        if args.mode == "convert" and not args.input:
+            parser.error("--input is required for convert mode")
+        if args.mode == "procedural" and not args.type:
+            parser.error("--type is required for procedural mode")
+
+        # Generate every job in this process, sharing permutation tables,
+        # compiled kernels and imports between seeds
+        for seed, output_path in jobs:
+            job_texture_config: TextureConfig = replace(
+                texture_config, output_path=output_path
+            )
+            generator: SphereTextureGenerator = SphereTextureGenerator(
+                job_texture_config, replace(noise_config, seed=seed)
+            )
+
+            # Execute based on mode
+            if args.mode == "convert":
+                generator.convert_image(args.input)
+            elif args.mode == "procedural" and args.lods:
+                for lod_path in generator.generate_procedural_with_lods(
+                    args.type, args.lods, **kwargs
+                ):
+                    print(f"🔽 LOD saved: {lod_path}")
+            elif args.mode == "procedural":
+                generator.generate_procedural(args.type, **kwargs)
 
-        # Execute based on mode
-        if args.mode == "convert":
-            if not args.input:
-                parser.error("--input is required for convert mode")
-            generator.convert_image(args.input)
-        elif args.mode == "procedural":
-            if not args.type:
-                parser.error("--type is required for procedural mode")
-            generator.generate_procedural(args.type, **kwargs)
+            print_summary(job_texture_config, kwargs)
 
         logger.info("✅ Operation completed successfully.")
-        print("\n" + "=" * 60)
-        print("📊 Generation summary")
-        print("=" * 60)
-        print(f"✅ File saved: {texture_config.output_path}")
-        print(f"📏 Final size: {texture_config.width}x{texture_config.height}")
-        print(f"📦 Format: {texture_config.format}")
-        print(f"💾 File size: {texture_config.output_path.stat().st_size // 1024}KB")
-        if kwargs:
-            print(f"🎨 Colors: {kwargs}")
-        print("=" * 60)
         return 0
 
     except (ValueError, OSError) as e:
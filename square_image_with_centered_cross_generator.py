@@ -7,15 +7,39 @@ The size must be odd to ensure perfect centering.
 """
 
 import argparse
+import io
+import string
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional
-from PIL import Image, ImageDraw
 
+import numpy as np
+from PIL import Image
 
+# Encoder options per output format. The image is made of flat color areas,
+# so lossless WEBP is both smaller and faster to encode than lossy WEBP. The
+# PNG zlib level is passed separately (see DEFAULT_COMPRESS_LEVEL)
+SAVE_OPTIONS = {
+    "png": {},
+    "webp": {"lossless": True},
+}
+
+# Fastest zlib level: about twice as fast as level 9 on large crosses, for
+# files about four times bigger. Use 9 for the smallest files
+DEFAULT_COMPRESS_LEVEL = 1
+
+# Characters allowed in a HEX color. int(..., 16) alone would also accept
+# signs, spaces and underscore separators
+HEX_DIGITS = frozenset(string.hexdigits)
+
+
+@lru_cache(maxsize=256)
 def parse_color(color_str: str) -> Tuple[int, int, int]:
     """Parse color from RGB, HEX, or INT format.
 
+    Results are cached, so repeated colors in batch use are parsed once.
+
     Args:
         color_str: String representing the color (e.g., "255,0,0", "#ff0000", "128")
 
@@ -41,17 +65,21 @@ def parse_color(color_str: str) -> Tuple[int, int, int]:
             hex_str = color_str
 
         if len(hex_str) == 6:
-            return (
-                int(hex_str[0:2], 16),
-                int(hex_str[2:4], 16),
-                int(hex_str[4:6], 16),
-            )
+            if not HEX_DIGITS.issuperset(hex_str):
+                raise ValueError(f"Invalid HEX color: {color_str}")
+            # Parse once, then unpack the channels from the packed value
+            packed = int(hex_str, 16)
+            return (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF
 
         # Try RGB format (255,0,255)
         if "," in color_str:
-            parts = [int(x.strip()) for x in color_str.split(",")]
-            if len(parts) == 3 and all(0 <= x <= 255 for x in parts):
-                return tuple(parts)  # type: ignore
+            parts = color_str.split(",")
+            if len(parts) == 3:
+                red, green, blue = int(parts[0]), int(parts[1]), int(parts[2])
+                # The OR is negative if any channel is, and above 255 if any
+                # channel sets a bit past the low 8, so one range test is enough
+                if 0 <= (red | green | blue) <= 255:
+                    return red, green, blue
 
         # Try single INT value (grayscale)
         color_int = int(color_str)
@@ -76,6 +104,7 @@ def generate_cross_image(
     bg_color: Tuple[int, int, int],
     output_format: str = "png",
     cross_thickness: Optional[int] = None,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
 ) -> None:
     """Generate square image with centered cross.
 
@@ -85,6 +114,7 @@ def generate_cross_image(
         bg_color: Background color as an RGB tuple.
         output_format: Output format ('png' or 'webp').
         cross_thickness: Optional thickness of cross (default: size//20).
+        compress_level: PNG zlib compression level, 0 (none) to 9 (smallest).
 
     Raises:
         ValueError: If size is even or format unsupported.
@@ -102,39 +132,50 @@ def generate_cross_image(
     if thickness <= 0:
         raise ValueError("Cross thickness must be positive")
 
-    # Create a new image
-    image = Image.new("RGB", (size, size), bg_color)
-    draw = ImageDraw.Draw(image)
-
-    # Calculate center position
+    # Calculate the cross band, clipped to the image like a drawn rectangle
     center = size // 2
-
-    # Draw a horizontal line
-    draw.rectangle(
-        [(center - thickness, 0), (center + thickness, size)],
-        fill=cross_color,
-    )
-
-    # Draw a vertical line
-    draw.rectangle(
-        [(0, center - thickness), (size, center + thickness)],
-        fill=cross_color,
-    )
+    band_start = max(0, center - thickness)
+    band_end = min(size, center + thickness + 1)
+    band = slice(band_start, band_end)
+
+    # Each pixel is written once: the background only fills the four corner
+    # blocks outside both bands, the cross covers the rest
+    pixels = np.empty((size, size, 3), dtype=np.uint8)
+    outside = (slice(0, band_start), slice(band_end, size))
+    for rows in outside:
+        for columns in outside:
+            pixels[rows, columns] = bg_color
+    pixels[:, band] = cross_color
+    pixels[band, :] = cross_color
+    image = Image.fromarray(pixels)
 
     # Save image with format handling
     filename = f"cross_{size}_thick{thickness}.{output_format}"
 
+    # Encode in memory, then write the whole file at once
+    buffer = io.BytesIO()
     try:
-        image.save(filename, format=output_format)
-        print(f"✓ Image generated: {filename}")
+        image.save(
+            buffer,
+            format=output_format,
+            compress_level=compress_level,
+            **SAVE_OPTIONS[output_format],
+        )
     except ValueError:
         if output_format == "webp":
             print("⚠ WEBP format not available, using PNG instead.")
             filename = f"cross_{size}_thick{thickness}.png"
-            image.save(filename, format="png")
-            print(f"✓ Image generated: {filename}")
+            buffer = io.BytesIO()
+            image.save(
+                buffer,
+                format="png",
+                compress_level=compress_level,
+                **SAVE_OPTIONS["png"],
+            )
         else:
             raise
+    Path(filename).write_bytes(buffer.getvalue())
+    print(f"✓ Image generated: {filename}")
 
 
 def main() -> None:
@@ -192,6 +233,17 @@ def main() -> None:
         help="Custom cross thickness (default: auto-calculated as size//20)",
     )
 
+    parser.add_argument(
+        "-z",
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESS_LEVEL,
+        metavar="{0-9}",
+        help=f"PNG compression level, 9 for the smallest files "
+        f"(default: {DEFAULT_COMPRESS_LEVEL}, fastest)",
+    )
+
     try:
         args = parser.parse_args()
 
@@ -206,6 +258,7 @@ def main() -> None:
             bg_color=bg_color,
             output_format=args.format,
             cross_thickness=args.thickness,
+            compress_level=args.compress_level,
         )
 
     except ValueError as e:
@@ -14,7 +14,12 @@ The generated SVG distinguishes between cut lines (solid black) and fold lines
 import math
 from typing import Tuple
 
-import svgwrite
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, compute_wall_corners runs as plain Python
+    njit = None
 
 # --- Type Alias for Clarity ---
 Vector2D = Tuple[float, float]
@@ -22,6 +27,18 @@ Vector2D = Tuple[float, float]
 # --- Constants ---
 PAGE_WIDTH_MM = 210  # A4 paper width
 PAGE_HEIGHT_MM = 297  # A4 paper height
+SQRT3_OVER_2 = math.sqrt(3) / 2  # Height of an equilateral triangle per unit edge
+
+# The pattern only has two shapes, so the SVG is written directly from
+# templates rather than built as an XML tree. Both lines are unfilled and
+# 0.5 mm wide, so those attributes are set once on a group around them
+SVG_HEADER = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    f'<svg xmlns="http://www.w3.org/2000/svg" width="{PAGE_WIDTH_MM}mm" '
+    f'height="{PAGE_HEIGHT_MM}mm" viewBox="0 0 {PAGE_WIDTH_MM} {PAGE_HEIGHT_MM}">\n'
+    '<g fill="none" stroke-width="0.5">\n'
+)
+SVG_FOOTER = "</g>\n</svg>\n"
 
 
 # --- Vector Geometry Helper Functions ---
@@ -91,7 +108,7 @@ def normalize_vector(v: Vector2D) -> Vector2D:
         >>> normalize_vector((3, 4))
         (0.6, 0.8)
     """
-    magnitude = math.sqrt(v[0] ** 2 + v[1] ** 2)
+    magnitude = math.hypot(v[0], v[1])
     if magnitude == 0:
         return 0.0, 0.0
     return v[0] / magnitude, v[1] / magnitude
@@ -113,6 +130,50 @@ def get_perpendicular_vector(v: Vector2D) -> Vector2D:
     return -v[1], v[0]
 
 
+def compute_wall_corners(vertices: np.ndarray, wall_height_mm: float) -> np.ndarray:
+    """Calculates the outer corner points of the unfolded walls.
+
+    Each wall is pushed outward from its base side along the side's normal,
+    so every vertex gets two outer corners that bound its corner arc. Written
+    as plain loops so it can be JIT-compiled by Numba when available.
+
+    Args:
+        vertices: The base triangle vertices as a (3, 2) array.
+        wall_height_mm: The final height of the vase's walls in mm.
+
+    Returns:
+        A (3, 2, 2) array: for each vertex, the corner along the previous
+        side's normal ("a") then the corner along the next side's normal ("b").
+
+    Example:
+        >>> compute_wall_corners(np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]), 1.0)[0, 1]
+        array([0., 1.])
+    """
+    normals = np.zeros((3, 2))
+    for i in range(3):
+        # Perpendicular of the side towards the next vertex, normalized
+        side_x = vertices[(i + 1) % 3, 0] - vertices[i, 0]
+        side_y = vertices[(i + 1) % 3, 1] - vertices[i, 1]
+        magnitude = math.hypot(side_x, side_y)
+        if magnitude != 0:
+            normals[i, 0] = -side_y / magnitude
+            normals[i, 1] = side_x / magnitude
+
+    corners = np.empty((3, 2, 2))
+    for i in range(3):
+        previous = (i + 2) % 3
+        for axis in range(2):
+            offset_a = normals[previous, axis] * wall_height_mm
+            offset_b = normals[i, axis] * wall_height_mm
+            corners[i, 0, axis] = vertices[i, axis] + offset_a
+            corners[i, 1, axis] = vertices[i, axis] + offset_b
+    return corners
+
+
+if njit is not None:
+    compute_wall_corners = njit(cache=True, fastmath=True)(compute_wall_corners)
+
+
 def generate_straight_vase_pattern(
     base_edge_mm: float = 80.0,
     wall_height_mm: float = 120.0,
@@ -131,21 +192,13 @@ def generate_straight_vase_pattern(
         wall_height_mm: The final height of the vase's walls in mm.
         filename: The name of the SVG file to create.
     """
-    # --- SVG Document Setup ---
-    dwg = svgwrite.Drawing(
-        filename,
-        size=(f"{PAGE_WIDTH_MM}mm", f"{PAGE_HEIGHT_MM}mm"),
-        profile="tiny",
-    )
-    dwg.viewbox(0, 0, PAGE_WIDTH_MM, PAGE_HEIGHT_MM)
-
     # --- Page Center Calculation ---
     center_x: float = PAGE_WIDTH_MM / 2
     center_y: float = PAGE_HEIGHT_MM / 2
 
     # --- Base Triangle Geometry ---
     s: float = base_edge_mm
-    triangle_height: float = s * math.sqrt(3) / 2
+    triangle_height: float = s * SQRT3_OVER_2
 
     # Vertices of the base triangle, centered on the page
     v1: Vector2D = (center_x, center_y - (2 / 3) * triangle_height)
@@ -155,73 +208,54 @@ def generate_straight_vase_pattern(
     # --- Pattern Drawing ---
 
     # 1. Base Triangle (Fold Lines)
-    fold_line_triangle = dwg.polygon(
-        points=[v1, v2, v3],
-        fill="none",
-        stroke="gray",
-        stroke_width=0.5,
-        stroke_dasharray="4 2",
+    triangle_points: str = " ".join(f"{x:.3f},{y:.3f}" for x, y in (v1, v2, v3))
+    fold_line_triangle: str = (
+        f'<polygon points="{triangle_points}" stroke="gray" '
+        'stroke-dasharray="4 2" />\n'
     )
-    dwg.add(fold_line_triangle)
 
     # 2. Outer Contour (Cut Lines)
     # This contour is composed of three straight wall tops and three corner arcs.
 
-    # Calculate side vectors and their outward-pointing perpendicular normals
-    side_vec_12 = subtract_vectors(v2, v1)
-    side_vec_23 = subtract_vectors(v3, v2)
-    side_vec_31 = subtract_vectors(v1, v3)
-
-    normal_vec_12 = normalize_vector(get_perpendicular_vector(side_vec_12))
-    normal_vec_23 = normalize_vector(get_perpendicular_vector(side_vec_23))
-    normal_vec_31 = normalize_vector(get_perpendicular_vector(side_vec_31))
-
     # Calculate the corner points of the unfolded outer walls
     # For each vertex (v1, v2, v3), there are two outer points that define the arc
-    wall_corner_1a = add_vectors(v1, scale_vector(normal_vec_31, wall_height_mm))
-    wall_corner_1b = add_vectors(v1, scale_vector(normal_vec_12, wall_height_mm))
-
-    wall_corner_2a = add_vectors(v2, scale_vector(normal_vec_12, wall_height_mm))
-    wall_corner_2b = add_vectors(v2, scale_vector(normal_vec_23, wall_height_mm))
-
-    wall_corner_3a = add_vectors(v3, scale_vector(normal_vec_23, wall_height_mm))
-    wall_corner_3b = add_vectors(v3, scale_vector(normal_vec_31, wall_height_mm))
-
-    # Construct the SVG path string for the outer cutting line
-    cut_path_str = (
-        f"M {wall_corner_1a[0]},{wall_corner_1a[1]} "
-        f"A {wall_height_mm},{wall_height_mm} 0 0 1 {wall_corner_1b[0]},{wall_corner_1b[1]} "
-        f"L {wall_corner_2a[0]},{wall_corner_2a[1]} "
-        f"A {wall_height_mm},{wall_height_mm} 0 0 1 {wall_corner_2b[0]},{wall_corner_2b[1]} "
-        f"L {wall_corner_3a[0]},{wall_corner_3a[1]} "
-        f"A {wall_height_mm},{wall_height_mm} 0 0 1 {wall_corner_3b[0]},{wall_corner_3b[1]} "
-        f"L {wall_corner_1a[0]},{wall_corner_1a[1]} "
-        "Z"
+    wall_corners: np.ndarray = compute_wall_corners(
+        np.array([v1, v2, v3]), wall_height_mm
     )
 
-    cut_path = dwg.path(d=cut_path_str, fill="none", stroke="black", stroke_width=0.5)
-    dwg.add(cut_path)
+    # Construct the SVG path string for the outer cutting line: an arc around
+    # each vertex, then a straight wall top to the next vertex's first corner.
+    # Coordinates use 0.001 mm precision, well past printer resolution.
+    radius: str = f"{wall_height_mm:.3f}"
+    first_x, first_y = wall_corners[0, 0]
+    path_parts: list[str] = [f"M {first_x:.3f},{first_y:.3f}"]
+    for i in range(3):
+        arc_x, arc_y = wall_corners[i, 1]
+        wall_x, wall_y = wall_corners[(i + 1) % 3, 0]
+        path_parts.append(f"A {radius},{radius} 0 0 1 {arc_x:.3f},{arc_y:.3f}")
+        path_parts.append(f"L {wall_x:.3f},{wall_y:.3f}")
+    path_parts.append("Z")
+    cut_path_str = " ".join(path_parts)
+
+    cut_path: str = f'<path d="{cut_path_str}" stroke="black" />\n'
 
     # # --- Add Informational Text ---
-    # info_text = dwg.text(
-    #     f"Straight Vase Pattern - Base: {s}mm, Height: {wall_height_mm}mm",
-    #     insert=(10, PAGE_HEIGHT_MM - 10),
-    #     fill="black",
-    #     font_size="10px",
-    #     font_family="Arial",
+    # info_text = (
+    #     f'<text x="10" y="{PAGE_HEIGHT_MM - 10}" fill="black" font-size="10px" '
+    #     f'font-family="Arial">Straight Vase Pattern - Base: {s}mm, '
+    #     f"Height: {wall_height_mm}mm</text>\n"
     # )
-    # instruction_text = dwg.text(
-    #     "Solid Line = Cut | Dashed Line = Fold",
-    #     insert=(10, PAGE_HEIGHT_MM - 20),
-    #     fill="black",
-    #     font_size="10px",
-    #     font_family="Arial",
+    # instruction_text = (
+    #     f'<text x="10" y="{PAGE_HEIGHT_MM - 20}" fill="black" font-size="10px" '
+    #     'font-family="Arial">Solid Line = Cut | Dashed Line = Fold</text>\n'
     # )
-    # dwg.add(info_text)
-    # dwg.add(instruction_text)
 
     # --- Save the File ---
-    dwg.save()
+    with open(filename, "w", encoding="utf-8") as svg_file:
+        svg_file.write(SVG_HEADER)
+        svg_file.write(fold_line_triangle)
+        svg_file.write(cut_path)
+        svg_file.write(SVG_FOOTER)
     print(f"Pattern successfully generated in file: '{filename}'")
 
 
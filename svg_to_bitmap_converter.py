@@ -2,20 +2,57 @@
 
 import argparse
 import logging
+import re
+import struct
 import sys
 import threading
-import xml.etree.ElementTree as ElT
+from functools import lru_cache
 from pathlib import Path
 
 try:
-    from PIL import Image, ImageDraw
+    from lxml import etree as ElT
+
+    # libxml2 reports comments and processing instructions as nodes, drop
+    # them at parse time so that only elements are seen, like ElementTree
+    ITERPARSE_OPTIONS = {"remove_comments": True, "remove_pis": True}
+except ImportError:  # lxml is optional, the standard library parser is used instead
+    import xml.etree.ElementTree as ElT
+
+    ITERPARSE_OPTIONS = {}
+    try:
+        # ElementTree silently uses its C accelerator when it is importable
+        import _elementtree  # noqa: F401
+    except ImportError:
+        print("[Warning: no C accelerator for ElementTree, SVG parsing will be slow]")
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, rectangles are then filled from Python
+    njit = None
+
+try:
+    from PIL import Image
 except ImportError:
-    Image = ImageDraw = None
+    Image = None
     print("[Error: Pillow is required. Install with: pip install Pillow]")
     sys.exit(1)
 
 logger = logging.getLogger(__name__)
 
+SVG_RECT_TAG = "{http://www.w3.org/2000/svg}rect"
+PARSE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# viewBox values may be separated by whitespace and/or commas
+VIEWBOX_SEPARATOR_RE = re.compile(r"[\s,]+")
+# Leading number of a length attribute, whatever its unit (px, pt, ...)
+SVG_LENGTH_RE = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+
+# BMP output: white background (no transparency) and 96 DPI, as Pillow writes
+BMP_BACKGROUND = (255, 255, 255, 255)
+BMP_PIXELS_PER_METER = 3780
+
 
 class OutputHandler:
     """Integrated output handler for command-line applications.
@@ -30,8 +67,11 @@ class OutputHandler:
             verbosity_level: Output verbosity (0=quiet, 1=normal, 2=verbose).
             no_color: Disable color output.
         """
-        self._output_lock = threading.RLock()
+        # out() is the only user and never re-enters, a plain lock is enough
+        self._output_lock = threading.Lock()
         self.verbosity_level = verbosity_level
+        # Lets hot loops skip building verbose messages that would be dropped
+        self.is_verbose = verbosity_level >= 2
         self.no_color = no_color
         self.stderr = sys.stderr
         self.stdout = sys.stdout
@@ -77,11 +117,14 @@ class OutputHandler:
         with self._output_lock:
             colored_message = self._colorize(message, msg_type)
             if msg_type == "error":
+                # stdout is only flushed here, to keep messages in order when
+                # both streams go to the same place; the interpreter flushes
+                # it at exit
+                self.stdout.flush()
                 self.stderr.write(f"{colored_message}\n")
                 self.stderr.flush()
             else:
                 self.stdout.write(f"{colored_message}\n")
-                self.stdout.flush()
 
     def out_success(self, message: str, level: int = 1) -> None:
         """Output success message.
@@ -90,7 +133,8 @@ class OutputHandler:
             message: Success message.
             level: Required verbosity level.
         """
-        self.out(f"[SUCCESS] {message}", level, "success")
+        if self.verbosity_level >= level:
+            self.out(f"[SUCCESS] {message}", level, "success")
 
     def out_warning(self, message: str, level: int = 1) -> None:
         """Output warning message.
@@ -99,7 +143,8 @@ class OutputHandler:
             message: Warning message.
             level: Required verbosity level.
         """
-        self.out(f"[WARNING] {message}", level, "warning")
+        if self.verbosity_level >= level:
+            self.out(f"[WARNING] {message}", level, "warning")
 
     def out_error(self, message: str, level: int = 0) -> None:
         """Output error message.
@@ -117,7 +162,8 @@ class OutputHandler:
             message: Info message.
             level: Required verbosity level.
         """
-        self.out(f"[INFO] {message}", level, "info")
+        if self.verbosity_level >= level:
+            self.out(f"[INFO] {message}", level, "info")
 
     def out_verbose(self, message: str) -> None:
         """Output verbose message (level 2).
@@ -125,13 +171,119 @@ class OutputHandler:
         Args:
             message: Verbose message.
         """
-        self.out(f"[VERBOSE] {message}", 2, "info")
+        # Checked here so that filtered messages are not decorated at all
+        if self.is_verbose:
+            self.out(f"[VERBOSE] {message}", 2, "info")
 
 
 class ConversionError(Exception):
     """Exception raised when SVG conversion fails."""
 
 
+if njit is not None:
+
+    @njit(cache=True)
+    def _fill_rectangles_kernel(
+        pixels: np.ndarray, rectangles: np.ndarray, colors: np.ndarray
+    ) -> None:
+        """Fill rectangles on a packed RGBA canvas, in order (Numba kernel).
+
+        Rectangles are drawn one after the other so that overlaps keep the
+        SVG painting order. Both edges are included and clipped to the
+        canvas, like ImageDraw.rectangle.
+
+        Args:
+            pixels: (height, width) uint32 canvas, modified in place.
+            rectangles: (N, 4) array of rectangle x, y, width and height.
+            colors: Packed color of each rectangle.
+        """
+        for i in range(rectangles.shape[0]):
+            x = rectangles[i, 0]
+            y = rectangles[i, 1]
+            pixels[
+                max(y, 0) : max(y + rectangles[i, 3] + 1, 0),
+                max(x, 0) : max(x + rectangles[i, 2] + 1, 0),
+            ] = colors[i]
+
+
+def encode_bmp(pixels: np.ndarray) -> bytes:
+    """Encode an RGB array as an uncompressed 24-bit BMP file.
+
+    Args:
+        pixels: (height, width, 3) uint8 array of RGB pixels.
+
+    Returns:
+        BMP file contents, identical to what Pillow writes for an RGB image.
+    """
+    height, width, _ = pixels.shape
+    stride = (width * 3 + 3) & ~3
+    header = struct.pack(
+        "<2sIIIIIIHHIIIIII",
+        b"BM",
+        54 + stride * height,  # file size
+        0,
+        54,  # pixel data offset
+        40,  # info header size
+        width,
+        height,
+        1,  # planes
+        24,  # bits per pixel
+        0,  # no compression
+        stride * height,
+        BMP_PIXELS_PER_METER,
+        BMP_PIXELS_PER_METER,
+        0,
+        0,
+    )
+    # Rows are stored bottom-up in BGR order, each padded to 4 bytes
+    data = np.zeros((height, stride), dtype=np.uint8)
+    data[:, : width * 3] = pixels[::-1, :, ::-1].reshape(height, width * 3)
+    return header + data.tobytes()
+
+
+# Named colors (basic set)
+NAMED_COLORS: dict[str, tuple[int, int, int, int]] = {
+    "black": (0, 0, 0, 255),
+    "white": (255, 255, 255, 255),
+    "red": (255, 0, 0, 255),
+    "green": (0, 255, 0, 255),
+    "blue": (0, 0, 255, 255),
+    "transparent": (0, 0, 0, 0),
+}
+
+
+@lru_cache(maxsize=256)
+def parse_color(color_str: str) -> tuple[int, int, int, int] | None:
+    """Parse a fill color string to an RGBA tuple.
+
+    Results are cached: SVG files usually reuse a handful of fills, so each
+    distinct string is parsed once per process.
+
+    Args:
+        color_str: Color in hex format (#RRGGBB) or color name.
+
+    Returns:
+        RGBA color tuple, or None if the color name is unknown.
+
+    Raises:
+        ConversionError: If the hex color format is invalid.
+    """
+    color_str = color_str.strip()
+
+    if color_str.startswith("#"):
+        # Hex color
+        hex_color = color_str[1:]
+        if len(hex_color) != 6:
+            raise ConversionError(f"Hex color must be 6 characters: {color_str}")
+        try:
+            r, g, b = bytes.fromhex(hex_color)
+            return r, g, b, 255
+        except ValueError as e:
+            raise ConversionError(f"Invalid hex color format: {color_str}") from e
+
+    return NAMED_COLORS.get(color_str.lower())
+
+
 class SVGParser:
     """Parser for simple rectangle-based SVG files."""
 
@@ -146,7 +298,10 @@ class SVGParser:
         self.out = output_handler
         self.width: int = 0
         self.height: int = 0
-        self.rectangles: list[dict[str, str | int]] = []
+        # Rectangles are stored column-wise: one (N, 4) array of x, y, width
+        # and height, and the matching list of fill colors
+        self.rectangles: np.ndarray = np.empty((0, 4), dtype=np.int64)
+        self.fills: list[str] = []
 
     def parse(self) -> None:
         """Parse SVG file and extract rectangle information.
@@ -156,9 +311,39 @@ class SVGParser:
         """
         self.out.out_verbose(f"Starting SVG parsing for file: {self.svg_path}")
 
+        # Single pass over the document: collect rectangle attributes and
+        # unsupported tags, freeing each rectangle once read
+        svg_rectangles: list[tuple[str, ...]] = []
+        plain_rectangles: list[tuple[str, ...]] = []
+        unsupported_elements: set[str] = set()
+        # Local names by qualified tag, documents only use a few distinct tags
+        local_names: dict[str, str] = {}
         try:
-            tree = ElT.parse(self.svg_path)
-            root = tree.getroot()
+            # A large read buffer means few read() calls on big documents
+            with self.svg_path.open("rb", buffering=PARSE_BUFFER_SIZE) as svg_file:
+                context = ElT.iterparse(svg_file, **ITERPARSE_OPTIONS)
+                for _, elem in context:
+                    tag = local_names.get(elem.tag)
+                    if tag is None:
+                        tag = local_names[elem.tag] = elem.tag.rpartition("}")[2]
+                    if tag == "rect":
+                        # Namespaced and plain rectangles are kept apart, the
+                        # plain ones are only used if there is no SVG one
+                        attributes = (
+                            elem.get("x", "0"),
+                            elem.get("y", "0"),
+                            elem.get("width", "0"),
+                            elem.get("height", "0"),
+                            elem.get("fill", "#000000"),
+                        )
+                        if elem.tag == SVG_RECT_TAG:
+                            svg_rectangles.append(attributes)
+                        elif elem.tag == "rect":
+                            plain_rectangles.append(attributes)
+                        elem.clear()
+                    elif tag != "svg":
+                        unsupported_elements.add(tag)
+            root = context.root
             self.out.out_verbose("Successfully loaded XML tree")
         except ElT.ParseError as e:
             error_msg = f"Invalid SVG format: {e}"
@@ -183,7 +368,9 @@ class SVGParser:
             if view_box:
                 self.out.out_verbose(f"Found viewBox: {view_box}")
                 try:
-                    _, _, width_str, height_str = view_box.split()
+                    _, _, width_str, height_str = VIEWBOX_SEPARATOR_RE.split(
+                        view_box.strip()
+                    )
                     self.width = int(float(width_str))
                     self.height = int(float(height_str))
                 except (ValueError, TypeError) as e:
@@ -193,8 +380,14 @@ class SVGParser:
                 width_attr = root.get("width", "0")
                 height_attr = root.get("height", "0")
                 try:
-                    self.width = int(float(width_attr.replace("px", "")))
-                    self.height = int(float(height_attr.replace("px", "")))
+                    width_match = SVG_LENGTH_RE.match(width_attr)
+                    height_match = SVG_LENGTH_RE.match(height_attr)
+                    if width_match is None or height_match is None:
+                        raise ValueError(
+                            f"not a length: {width_attr!r} x {height_attr!r}"
+                        )
+                    self.width = int(float(width_match.group(1)))
+                    self.height = int(float(height_match.group(1)))
                 except (ValueError, TypeError) as e:
                     raise ConversionError(
                         f"Invalid width/height attributes: {e}"
@@ -214,73 +407,50 @@ class SVGParser:
             self.out.out_error(error_msg)
             raise ConversionError(error_msg) from e
 
-        # Find all rectangles
-        try:
-            namespace = {"": "http://www.w3.org/2000/svg"}
-            rectangles = root.findall(".//rect", namespace) or root.findall(".//rect")
-
-            if not rectangles:
-                self.out.out_warning("No rectangles found in SVG")
-            else:
-                self.out.out_verbose(f"Found {len(rectangles)} rectangles")
-
-        except Exception as e:
-            error_msg = f"Error finding rectangles in SVG: {e}"
-            self.out.out_error(error_msg)
-            raise ConversionError(error_msg) from e
+        rectangles = svg_rectangles or plain_rectangles
+        if not rectangles:
+            self.out.out_warning("No rectangles found in SVG")
+        else:
+            self.out.out_verbose(f"Found {len(rectangles)} rectangles")
 
         # Check for unsupported elements
-        try:
-            all_elements = list(root.iter())
-            unsupported_elements = []
-            for elem in all_elements:
-                try:
-                    tag = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                    if tag not in ["svg", "rect"]:
-                        unsupported_elements.append(tag)
-                except (AttributeError, IndexError) as e:
-                    self.out.out_warning(f"Error processing element tag: {e}")
-
-            if unsupported_elements:
-                unique_unsupported = list(set(unsupported_elements))
-                error_msg = (
-                    f"SVG contains unsupported elements: "
-                    f"{', '.join(unique_unsupported)}. Only rectangles are supported."
-                )
-                self.out.out_error(error_msg)
-                raise ConversionError(error_msg)
-
-        except ConversionError:
-            raise
-        except Exception as e:
-            error_msg = f"Error checking for unsupported elements: {e}"
+        if unsupported_elements:
+            error_msg = (
+                f"SVG contains unsupported elements: "
+                f"{', '.join(unsupported_elements)}. Only rectangles are supported."
+            )
             self.out.out_error(error_msg)
-            raise ConversionError(error_msg) from e
+            raise ConversionError(error_msg)
 
         # Extract rectangle data
         try:
-            for i, rect in enumerate(rectangles):
+            geometry: list[tuple[int, int, int, int]] = []
+            for i, (x, y, width, height, fill) in enumerate(rectangles):
                 try:
-                    rect_data = {
-                        "x": int(float(rect.get("x", "0"))),
-                        "y": int(float(rect.get("y", "0"))),
-                        "width": int(float(rect.get("width", "0"))),
-                        "height": int(float(rect.get("height", "0"))),
-                        "fill": rect.get("fill", "#000000"),
-                    }
-                    self.rectangles.append(rect_data)
-
-                    self.out.out_verbose(
-                        f"Rectangle {i + 1}: x={rect_data['x']}, y={rect_data['y']}, "
-                        f"w={rect_data['width']}, h={rect_data['height']}, "
-                        f"fill={rect_data['fill']}"
+                    rect_geometry = (
+                        int(float(x)),
+                        int(float(y)),
+                        int(float(width)),
+                        int(float(height)),
                     )
+                    geometry.append(rect_geometry)
+                    self.fills.append(fill)
+
+                    if self.out.is_verbose:
+                        self.out.out_verbose(
+                            f"Rectangle {i + 1}: x={rect_geometry[0]}, "
+                            f"y={rect_geometry[1]}, w={rect_geometry[2]}, "
+                            f"h={rect_geometry[3]}, fill={fill}"
+                        )
 
                 except (ValueError, TypeError) as e:
                     error_msg = f"Invalid rectangle {i + 1} attributes: {e}"
                     self.out.out_error(error_msg)
                     raise ConversionError(error_msg) from e
 
+            if geometry:
+                self.rectangles = np.array(geometry, dtype=np.int64)
+
         except ConversionError:
             raise
         except Exception as e:
@@ -307,12 +477,13 @@ class BitmapConverter:
         self.out = output_handler
 
     def convert(
-        self, rectangles: list[dict[str, str | int]], output_path: Path
+        self, rectangles: np.ndarray, fills: list[str], output_path: Path
     ) -> None:
         """Convert rectangle data to bitmap image.
 
         Args:
-            rectangles: List of rectangle data dictionaries.
+            rectangles: (N, 4) array of rectangle x, y, width and height.
+            fills: Fill color of each rectangle.
             output_path: Path where to save the bitmap image.
 
         Raises:
@@ -321,39 +492,68 @@ class BitmapConverter:
         self.out.out_verbose(f"Starting bitmap conversion to: {output_path}")
         self.out.out_verbose(f"Image dimensions: {self.width}x{self.height}")
 
+        is_bmp = output_path.suffix.lower() == ".bmp"
+
         try:
-            # Create an image with a transparent background
+            # Create a canvas with one packed RGBA uint32 per pixel, so that
+            # each rectangle is filled with a single scalar store. BMP has no
+            # transparency: its canvas starts white and transparent fills are
+            # drawn as white, which is what compositing on white would give
+            background = BMP_BACKGROUND if is_bmp else (0, 0, 0, 0)
             try:
-                image = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-                draw = ImageDraw.Draw(image)
+                pixels = np.full(
+                    (self.height, self.width),
+                    np.array(background, dtype=np.uint8).view(np.uint32)[0],
+                )
                 self.out.out_verbose("Created RGBA image canvas")
             except Exception as e:
                 error_msg = f"Failed to create image canvas: {e}"
                 self.out.out_error(error_msg)
                 raise ConversionError(error_msg) from e
 
+            # Parse each distinct fill once, in order of first use, and pack
+            # it in the canvas byte order
+            colors = {}
+            for fill in dict.fromkeys(fills):
+                rgba = self._parse_color(fill)
+                if is_bmp and not rgba[3]:
+                    rgba = BMP_BACKGROUND
+                colors[fill] = np.array(rgba, dtype=np.uint8).view(np.uint32)[0]
+
+            # Validate all sizes up front so the drawing loop has no handler
+            negative = np.flatnonzero((rectangles[:, 2:] < 0).any(axis=1))
+            if negative.size:
+                i = int(negative[0])
+                width, height = rectangles[i, 2:].tolist()
+                error_msg = (
+                    f"Error drawing rectangle {i + 1}: "
+                    f"Negative rectangle size: {width}x{height}"
+                )
+                self.out.out_error(error_msg)
+                raise ConversionError(error_msg)
+
             # Draw each rectangle
             try:
-                for i, rect in enumerate(rectangles):
-                    try:
-                        x = rect["x"]
-                        y = rect["y"]
-                        width = rect["width"]
-                        height = rect["height"]
-                        fill_color = self._parse_color(rect["fill"])
-
-                        # Draw rectangle
-                        draw.rectangle([x, y, x + width, y + height], fill=fill_color)
-
-                        self.out.out_verbose(
-                            f"Drew rectangle {i + 1} at ({x},{y}) "
-                            f"size {width}x{height} color {fill_color}"
-                        )
+                if njit is not None:
+                    _fill_rectangles_kernel(
+                        pixels,
+                        np.ascontiguousarray(rectangles, dtype=np.int64),
+                        np.fromiter(
+                            (colors[fill] for fill in fills),
+                            dtype=np.uint32,
+                            count=len(fills),
+                        ),
+                    )
+                else:
+                    for (x, y, width, height), fill in zip(rectangles.tolist(), fills):
+                        # Fill the rectangle, both edges included and clipped
+                        # to the canvas, like ImageDraw.rectangle
+                        pixels[
+                            max(y, 0) : max(y + height + 1, 0),
+                            max(x, 0) : max(x + width + 1, 0),
+                        ] = colors[fill]
 
-                    except (KeyError, TypeError, ValueError) as e:
-                        error_msg = f"Error drawing rectangle {i + 1}: {e}"
-                        self.out.out_error(error_msg)
-                        raise ConversionError(error_msg) from e
+                self.out.out_verbose(f"Drew {len(fills)} rectangles")
 
             except ConversionError:
                 raise
@@ -362,18 +562,20 @@ class BitmapConverter:
                 self.out.out_error(error_msg)
                 raise ConversionError(error_msg) from e
 
+            rgba_pixels = pixels.view(np.uint8).reshape(self.height, self.width, 4)
+
             # Save image
             try:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                if output_path.suffix.lower() == ".bmp":
-                    self.out.out_verbose("Converting to RGB for BMP format")
-                    # Convert to RGB for BMP format (no transparency)
-                    rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-                    rgb_image.paste(image, mask=image.split()[-1])  # Use alpha as mask
-                    rgb_image.save(output_path, "BMP")
+                # Usually the directory exists, a single stat is enough then
+                if not output_path.parent.is_dir():
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+                if is_bmp:
+                    # Already composited on white, write the RGB channels
+                    self.out.out_verbose("Writing RGB pixels for BMP format")
+                    output_path.write_bytes(encode_bmp(rgba_pixels[..., :3]))
                 else:
-                    image.save(output_path)
+                    Image.fromarray(rgba_pixels).save(output_path)
 
                 self.out.out_verbose("Image saved successfully")
                 self.out.out_success(f"Successfully converted to {output_path}")
@@ -414,39 +616,12 @@ class BitmapConverter:
             if isinstance(color_str, int):
                 return 0, 0, 0, 255
 
-            color_str = str(color_str).strip()
-
-            if color_str.startswith("#"):
-                # Hex color
-                hex_color = color_str[1:]
-                if len(hex_color) == 6:
-                    try:
-                        r = int(hex_color[0:2], 16)
-                        g = int(hex_color[2:4], 16)
-                        b = int(hex_color[4:6], 16)
-                        return r, g, b, 255
-                    except ValueError as e:
-                        raise ConversionError(
-                            f"Invalid hex color format: {color_str}"
-                        ) from e
-                else:
-                    raise ConversionError(
-                        f"Hex color must be 6 characters: {color_str}"
-                    )
-
-            # Named colors (basic set)
-            color_map = {
-                "black": (0, 0, 0, 255),
-                "white": (255, 255, 255, 255),
-                "red": (255, 0, 0, 255),
-                "green": (0, 255, 0, 255),
-                "blue": (0, 0, 255, 255),
-                "transparent": (0, 0, 0, 0),
-            }
-
-            result = color_map.get(color_str.lower(), (0, 0, 0, 255))
-            if color_str.lower() not in color_map:
-                self.out.out_warning(f"Unknown color '{color_str}', using black")
+            result = parse_color(str(color_str))
+            if result is None:
+                self.out.out_warning(
+                    f"Unknown color '{str(color_str).strip()}', using black"
+                )
+                return 0, 0, 0, 255
 
             return result
 
@@ -499,7 +674,7 @@ def convert_svg_to_bitmap(
         # Convert to bitmap
         try:
             converter = BitmapConverter(parser.width, parser.height, output_handler)
-            converter.convert(parser.rectangles, destination_path)
+            converter.convert(parser.rectangles, parser.fills, destination_path)
         except Exception as e:
             error_msg = f"Bitmap conversion failed: {e}"
             output_handler.out_error(error_msg)
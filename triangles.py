@@ -1,4 +1,6 @@
 import math
+
+import numpy as np
 from PIL import Image, ImageDraw
 
 # --- PARAMÈTRES ---
@@ -55,46 +57,50 @@ dessin = ImageDraw.Draw(image)
 
 # --- DESSIN DES TRIANGLES ---
 
-# Position de départ sur l'axe X
-x_curseur = marge_px
-
 # Coordonnées Y pour les 3 lignes horizontales du patron
 y_ligne_haute = marge_px
 y_ligne_milieu = marge_px + hauteur_px
 y_ligne_basse = marge_px + (2 * hauteur_px)
 
+# Table des sommets calculée en une fois : sommets[colonne, rangée, point, xy]
+# Chaque triangle est fermé (p1, p2, p3, p1) pour être tracé avec line()
+colonnes = np.arange(NOMBRE_DE_TRIANGLES_PAR_LIGNE)
+x_gauche = marge_px + colonnes * (arete_px / 2 + ecart_px)
+# Ligne 1 : le premier triangle (i=0) pointe vers le bas, comme demandé
+# Ligne 2 : en miroir, le premier triangle pointe vers le haut
+pointe_en_bas = colonnes % 2 == 0
+y_base = np.stack(
+    [
+        np.where(pointe_en_bas, y_ligne_haute, y_ligne_milieu),
+        np.where(pointe_en_bas, y_ligne_basse, y_ligne_milieu),
+    ],
+    axis=1,
+)
+y_pointe = np.stack(
+    [
+        np.where(pointe_en_bas, y_ligne_milieu, y_ligne_haute),
+        np.where(pointe_en_bas, y_ligne_milieu, y_ligne_basse),
+    ],
+    axis=1,
+)
+
+sommets = np.empty((NOMBRE_DE_TRIANGLES_PAR_LIGNE, 2, 4, 2))
+sommets[..., 0] = x_gauche[:, None, None] + np.array([0, arete_px, arete_px / 2, 0])
+sommets[..., 1] = y_base[..., None]
+sommets[:, :, 2, 1] = y_pointe
+
 print(f"Début du dessin de 2 lignes de {NOMBRE_DE_TRIANGLES_PAR_LIGNE} triangles...")
 
-for i in range(NOMBRE_DE_TRIANGLES_PAR_LIGNE):
-
-    # --- LIGNE 1 (HAUT) ---
-    # Le premier triangle (i=0) pointe vers le bas, comme demandé
-    if i % 2 == 0:  # Pointe vers le bas
-        p1 = (x_curseur, y_ligne_haute)
-        p2 = (x_curseur + arete_px, y_ligne_haute)
-        p3 = (x_curseur + arete_px / 2, y_ligne_milieu)
-    else:  # Pointe vers le haut
-        p1 = (x_curseur, y_ligne_milieu)
-        p2 = (x_curseur + arete_px, y_ligne_milieu)
-        p3 = (x_curseur + arete_px / 2, y_ligne_haute)
-
-    dessin.polygon([p1, p2, p3], outline=COULEUR_TRAIT, width=EPAISSEUR_TRAIT_PX)
-
-    # --- LIGNE 2 (BAS) - EN MIROIR ---
-    # Le premier triangle (i=0) pointe vers le haut (l'inverse de la ligne 1)
-    if i % 2 == 0:  # Pointe vers le haut
-        p1_m = (x_curseur, y_ligne_basse)
-        p2_m = (x_curseur + arete_px, y_ligne_basse)
-        p3_m = (x_curseur + arete_px / 2, y_ligne_milieu)
-    else:  # Pointe vers le bas
-        p1_m = (x_curseur, y_ligne_milieu)
-        p2_m = (x_curseur + arete_px, y_ligne_milieu)
-        p3_m = (x_curseur + arete_px / 2, y_ligne_basse)
-
-    dessin.polygon([p1_m, p2_m, p3_m], outline=COULEUR_TRAIT, width=EPAISSEUR_TRAIT_PX)
-
-    # Met à jour la position du curseur pour la prochaine COLONNE de triangles
-    x_curseur += arete_px / 2 + ecart_px
+for i, colonne in enumerate(sommets.tolist()):
+    for triangle in colonne:
+        # Contour fermé tracé en une ligne brisée : polygon() avec width > 1 est
+        # très lent dans Pillow, line() ne l'est pas
+        dessin.line(
+            [tuple(point) for point in triangle],
+            fill=COULEUR_TRAIT,
+            width=EPAISSEUR_TRAIT_PX,
+            joint="curve",
+        )
 
     print(f"  - Colonne de triangles {i + 1} dessinée.")
 
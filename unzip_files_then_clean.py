@@ -31,20 +31,25 @@ Example usage:
 """
 
 import argparse
+import errno
 import fcntl
 import os
 import re
 import shutil
 import sys
 import zipfile
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
 from pathlib import Path
-from typing import Generator, List, Set, Tuple, Literal, Optional
+from typing import Deque, Generator, List, Tuple, Literal, Optional
 
 # Constants
 MAX_ZIP_SIZE = 10 * 1024 * 1024 * 1024  # 10GB
 MAX_RECURSION_DEPTH = 10
+MAX_EXTRACTION_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+EXTRACT_BUFFER_SIZE = 1024 * 1024  # 1MB, upper bound of the per-file copy buffer
 DEFAULT_VERBOSITY = 2
 
 # Try to import optional dependencies for enhanced output
@@ -71,6 +76,17 @@ except ImportError:
         DIM = NORMAL = BRIGHT = RESET_ALL = ""
 
 
+# isal is optional, its DEFLATE decoder is about twice as fast as zlib's
+try:
+    from isal import isal_zlib
+
+    # zipfile gets its decompressor from zlib.decompressobj() for each member
+    zipfile.zlib = isal_zlib
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
+
 try:
     from rich.console import Console
     from rich.table import Table
@@ -164,14 +180,21 @@ class LogEntry:
     """Represents a single log entry with metadata.
 
     Attributes:
-        message: The log message content
+        message: The log message content, or a %-format string
         level: Severity level of the message
         timestamp: Optional timestamp (not currently used)
+        args: Arguments merged into message when the log is printed
     """
 
     message: str
     level: LogLevel = LogLevel.INFO
     timestamp: float | None = field(default=None, repr=False)
+    args: tuple = ()
+
+    @property
+    def text(self) -> str:
+        """Return the message formatted with its arguments."""
+        return self.message % self.args if self.args else self.message
 
 
 @dataclass
@@ -192,6 +215,9 @@ class OperationStats:
         dirs_ignored: Directories skipped during reorganization
         logs: Collection of all log entries
         removed_files_details: Detailed list of removed files/dirs
+        warnings: Number of WARNING log entries
+        errors: Number of ERROR log entries
+        verbose: Keep INFO log entries, which are only printed at verbosity 2
     """
 
     total_zips: int = 0
@@ -202,23 +228,51 @@ class OperationStats:
     dirs_examined: int = 0
     dirs_reorganized: int = 0
     dirs_ignored: int = 0
-    logs: List[LogEntry] = field(default_factory=list)
+    logs: Deque[LogEntry] = field(default_factory=deque)
     removed_files_details: List[str] = field(default_factory=list)
     warnings: int = 0
     errors: int = 0
+    verbose: bool = True
 
-    def add_log(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
+    def add_log(self, message: str, *args, level: LogLevel = LogLevel.INFO) -> None:
         """Add a new log entry to the collection.
 
+        As with the logging module, message is only formatted with args when
+        the log is printed, and INFO entries are dropped when the instance is
+        not verbose.
+
         Args:
-            message: The log message to add
+            message: The log message to add, or a %-format string
+            *args: Arguments for the %-format string
             level: Severity level of the message
+
+        Examples:
+            >>> my_stats = OperationStats()
+            >>> my_stats.add_log("Removed Apple file: %s", ".DS_Store")
         """
-        if level == LogLevel.WARNING:
+        if level == LogLevel.INFO:
+            if not self.verbose:
+                return
+        elif level == LogLevel.WARNING:
             self.warnings += 1
         elif level == LogLevel.ERROR:
             self.errors += 1
-        self.logs.append(LogEntry(message, level))
+        self.logs.append(LogEntry(message, level, args=args))
+
+    def merge(self, other: "OperationStats") -> None:
+        """Add the counters and logs of another instance to this one.
+
+        Args:
+            other: Statistics collected separately, e.g. by a worker thread
+        """
+        for stat_field in fields(self):
+            value = getattr(other, stat_field.name)
+            if isinstance(value, bool):
+                continue  # Settings such as verbose are not merged
+            if isinstance(value, (list, deque)):
+                getattr(self, stat_field.name).extend(value)
+            else:
+                setattr(self, stat_field.name, getattr(self, stat_field.name) + value)
 
     def add_removed_file_detail(self, path: str) -> None:
         """Add details of a removed file/directory for verbose output.
@@ -398,7 +452,7 @@ class OperationStats:
                 LogLevel.OPERATION: "[magenta]→[/magenta]",
                 LogLevel.DEBUG: "[blue]DEBUG[/blue]",
             }.get(log.level, "")
-            log_table.add_row(level_style, log.message)
+            log_table.add_row(level_style, log.text)
 
         console.print(log_table)
 
@@ -414,7 +468,7 @@ class OperationStats:
                 LogLevel.OPERATION: "→",
                 LogLevel.DEBUG: "[DBG]",
             }.get(log.level, "")
-            log_data.append([prefix, log.message])
+            log_data.append([prefix, log.text])
 
         print(
             tabulate(
@@ -426,22 +480,22 @@ class OperationStats:
         )
 
 
-# Constants for Apple system files/directories to remove
-APPLE_SYSTEM_FILES: Set[str] = {
-    ".DS_Store",
-    "._.DS_Store",
-    ".AppleDouble",
-    ".LSOverride",
-    re.compile(r"^\._.*$"),  # Files starting with ._
-}
+# Constants for Apple system files/directories to remove. File names are
+# matched by prefix (".DS_Store", ".AppleDouble", ".LSOverride", and "._"
+# which also covers "._.DS_Store"), with a single regex match per name
+APPLE_SYSTEM_FILE_RE: re.Pattern[str] = re.compile(
+    r"\.(?:DS_Store|AppleDouble|LSOverride|_)"
+)
 
-APPLE_SYSTEM_DIRS: Set[str] = {
-    "__MACOSX",
-    ".__MACOSX",
-    ".Spotlight-V100",
-    ".Trashes",
-    ".fseventsd",
-}
+APPLE_SYSTEM_DIRS: frozenset[str] = frozenset(
+    {
+        "__MACOSX",
+        ".__MACOSX",
+        ".Spotlight-V100",
+        ".Trashes",
+        ".fseventsd",
+    }
+)
 
 
 def is_apple_system_file(filename: str) -> bool:
@@ -461,17 +515,7 @@ def is_apple_system_file(filename: str) -> bool:
         >>> is_apple_system_file("normal_file.txt")
         False
     """
-    if filename in APPLE_SYSTEM_FILES:
-        return True
-
-    for pattern in APPLE_SYSTEM_FILES:
-        if isinstance(pattern, re.Pattern):
-            if pattern.match(filename):
-                return True
-        elif filename.startswith(pattern.replace("*", "")):
-            return True
-
-    return False
+    return APPLE_SYSTEM_FILE_RE.match(filename) is not None
 
 
 def check_readable(path: Path, stats: OperationStats) -> bool:
@@ -487,35 +531,42 @@ def check_readable(path: Path, stats: OperationStats) -> bool:
     try:
         # Check basic readability
         if not os.access(path, os.R_OK):
-            stats.add_log(f"Path not readable (no R_OK): {path}", LogLevel.DEBUG)
+            stats.add_log("Path not readable (no R_OK): %s", path, level=LogLevel.DEBUG)
             return False
 
         # For directories, we also need execute permission
         if path.is_dir() and not os.access(path, os.X_OK):
-            stats.add_log(f"Directory not executable (no X_OK): {path}", LogLevel.DEBUG)
+            stats.add_log(
+                "Directory not executable (no X_OK): %s", path, level=LogLevel.DEBUG
+            )
             return False
 
         return True
 
     except PermissionError as e:
         stats.add_log(
-            f"Permission denied checking readability: {path} - {str(e)}",
-            LogLevel.WARNING,
+            "Permission denied checking readability: %s - %s",
+            path,
+            e,
+            level=LogLevel.WARNING,
         )
         return False
     except FileNotFoundError:
         stats.add_log(
-            f"Path not found when checking readability: {path}", LogLevel.ERROR
+            "Path not found when checking readability: %s", path, level=LogLevel.ERROR
         )
         return False
     except OSError as e:
         stats.add_log(
-            f"OS error checking readability: {path} - {str(e)}", LogLevel.ERROR
+            "OS error checking readability: %s - %s", path, e, level=LogLevel.ERROR
         )
         return False
     except Exception as e:
         stats.add_log(
-            f"Unexpected error checking readability: {path} - {str(e)}", LogLevel.ERROR
+            "Unexpected error checking readability: %s - %s",
+            path,
+            e,
+            level=LogLevel.ERROR,
         )
         return False
 
@@ -536,36 +587,42 @@ def check_writable(path: Path, stats: OperationStats) -> bool:
             parent = path.parent
             if not os.access(parent, os.W_OK):
                 stats.add_log(
-                    f"Parent directory not writable: {parent}", LogLevel.DEBUG
+                    "Parent directory not writable: %s", parent, level=LogLevel.DEBUG
                 )
                 return False
             return True
 
         if not os.access(path, os.W_OK):
-            stats.add_log(f"Path not writable: {path}", LogLevel.DEBUG)
+            stats.add_log("Path not writable: %s", path, level=LogLevel.DEBUG)
             return False
         return True
 
     except PermissionError as e:
         stats.add_log(
-            f"Permission denied checking writability: {path} - {str(e)}",
-            LogLevel.WARNING,
+            "Permission denied checking writability: %s - %s",
+            path,
+            e,
+            level=LogLevel.WARNING,
         )
         return False
     except FileNotFoundError:
         stats.add_log(
-            f"Parent directory not found when checking writability: {path}",
-            LogLevel.ERROR,
+            "Parent directory not found when checking writability: %s",
+            path,
+            level=LogLevel.ERROR,
         )
         return False
     except OSError as e:
         stats.add_log(
-            f"OS error checking writability: {path} - {str(e)}", LogLevel.ERROR
+            "OS error checking writability: %s - %s", path, e, level=LogLevel.ERROR
         )
         return False
     except Exception as e:
         stats.add_log(
-            f"Unexpected error checking writability: {path} - {str(e)}", LogLevel.ERROR
+            "Unexpected error checking writability: %s - %s",
+            path,
+            e,
+            level=LogLevel.ERROR,
         )
         return False
 
@@ -591,17 +648,19 @@ def safe_path(path: Path, stats: OperationStats) -> Path:
             # Fallback to ASCII with replacement
             new_name = path.name.encode("ascii", errors="replace").decode("ascii")
             stats.add_log(
-                f"Converted problematic filename: {path.name} -> {new_name}",
-                LogLevel.INFO,
+                "Converted problematic filename: %s -> %s",
+                path.name,
+                new_name,
+                level=LogLevel.INFO,
             )
             return path.with_name(new_name)
         except Exception as e:
             stats.add_log(
-                f"Critical error in safe_path fallback: {str(e)}", LogLevel.ERROR
+                "Critical error in safe_path fallback: %s", e, level=LogLevel.ERROR
             )
             return path  # Return original as last resort
     except Exception as e:
-        stats.add_log(f"Unexpected error in safe_path: {str(e)}", LogLevel.ERROR)
+        stats.add_log("Unexpected error in safe_path: %s", e, level=LogLevel.ERROR)
         return path  # Return original on unexpected errors
 
 
@@ -621,36 +680,43 @@ def is_network_path(path: Path, stats: OperationStats) -> bool:
             is_mount = path.is_mount()
             if is_mount:
                 stats.add_log(
-                    f"Network path detected (is_mount=True): {path}", LogLevel.DEBUG
+                    "Network path detected (is_mount=True): %s",
+                    path,
+                    level=LogLevel.DEBUG,
                 )
             return is_mount
 
         # Fallback for older Python versions
         path_str = str(path)
         if any(part.startswith("\\\\") for part in path.parts):
-            stats.add_log(f"Network path detected (UNC path): {path}", LogLevel.DEBUG)
+            stats.add_log(
+                "Network path detected (UNC path): %s", path, level=LogLevel.DEBUG
+            )
             return True
         return False
 
     except AttributeError:
         stats.add_log(
-            "Path.is_mount() not available - using string detection", LogLevel.DEBUG
+            "Path.is_mount() not available - using string detection",
+            level=LogLevel.DEBUG,
         )
         try:
             if any(part.startswith("\\\\") for part in path.parts):
                 stats.add_log(
-                    f"Network path detected (fallback): {path}", LogLevel.DEBUG
+                    "Network path detected (fallback): %s", path, level=LogLevel.DEBUG
                 )
                 return True
             return False
         except Exception as e:
             stats.add_log(
-                f"Error in network path fallback detection: {str(e)}", LogLevel.ERROR
+                "Error in network path fallback detection: %s",
+                e,
+                level=LogLevel.ERROR,
             )
             return False
     except Exception as e:
         stats.add_log(
-            f"Unexpected error checking network path: {str(e)}", LogLevel.ERROR
+            "Unexpected error checking network path: %s", e, level=LogLevel.ERROR
         )
         return False
 
@@ -673,8 +739,9 @@ def is_path_too_long(path: Path, stats: OperationStats) -> bool:
             # 260 characters including null terminator
             if len(path_str) > 259:
                 stats.add_log(
-                    f"Windows path too long: {len(path_str)} characters",
-                    LogLevel.WARNING,
+                    "Windows path too long: %s characters",
+                    len(path_str),
+                    level=LogLevel.WARNING,
                 )
                 return True
 
@@ -684,23 +751,26 @@ def is_path_too_long(path: Path, stats: OperationStats) -> bool:
                     long_path = path.resolve()
                     if len(str(long_path)) > 259:
                         stats.add_log(
-                            f"Windows 8.3 path too long: {len(str(long_path))} characters",
-                            LogLevel.WARNING,
+                            "Windows 8.3 path too long: %s characters",
+                            len(str(long_path)),
+                            level=LogLevel.WARNING,
                         )
                         return True
                 except Exception as e:
-                    stats.add_log(f"Error resolving 8.3 path: {str(e)}", LogLevel.DEBUG)
+                    stats.add_log(
+                        "Error resolving 8.3 path: %s", e, level=LogLevel.DEBUG
+                    )
                     pass
 
         # Unix systems generally don't have length limits
         return False
 
     except OSError as e:
-        stats.add_log(f"OS error checking path length: {str(e)}", LogLevel.ERROR)
+        stats.add_log("OS error checking path length: %s", e, level=LogLevel.ERROR)
         return False
     except Exception as e:
         stats.add_log(
-            f"Unexpected error checking path length: {str(e)}", LogLevel.ERROR
+            "Unexpected error checking path length: %s", e, level=LogLevel.ERROR
         )
         return False
 
@@ -745,7 +815,80 @@ def release_lock(lock_fd: int | None, stats: OperationStats) -> None:
             os.close(lock_fd)
     except (OSError, AttributeError) as e:
         # AttributeError in case msvcrt import failed on Windows
-        stats.add_log(f"Error releasing lock: {e}", LogLevel.WARNING)
+        stats.add_log("Error releasing lock: %s", e, level=LogLevel.WARNING)
+
+
+def _rmtree_inode_sorted(path: str | Path) -> None:
+    """Remove a directory tree, deleting each directory's entries in inode order.
+
+    Deleting in directory order makes ext4 and similar file systems seek back
+    and forth through the inode table, which becomes quadratic on very large
+    trees; inode order keeps the accesses sequential. Like shutil.rmtree(),
+    symbolic links inside the tree are removed, not followed.
+
+    Args:
+        path: Directory to remove
+
+    Raises:
+        OSError: If path is a symbolic link or an entry cannot be removed
+    """
+    if os.path.islink(path):
+        raise OSError(f"Cannot call rmtree on a symbolic link: {path}")
+
+    def remove(directory: str | Path) -> None:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=os.DirEntry.inode)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                remove(entry.path)
+            else:
+                os.unlink(entry.path)
+        os.rmdir(directory)
+
+    remove(path)
+
+
+def _is_empty_dir(path: str | Path) -> bool:
+    """Check whether a directory is empty by reading at most one entry.
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        True if the directory has no entries, False otherwise
+
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
+
+def _scandir_recursive(path: str | Path) -> Generator[os.DirEntry, None, None]:
+    """Walk a directory tree, yielding each entry after everything below it.
+
+    Children come before their parent directory, so entries can be removed
+    while walking, and the entries of a directory come in inode order (see
+    _rmtree_inode_sorted()). Symbolic links are yielded but not followed and
+    directories that cannot be listed are skipped, like ``Path.glob("**/*")``.
+
+    Args:
+        path: Root directory to walk (not yielded itself)
+
+    Yields:
+        os.DirEntry objects, whose cached type avoids extra stat calls
+    """
+    try:
+        # Listed up front: the directory is modified while its entries are used
+        with os.scandir(path) as it:
+            entries = sorted(it, key=os.DirEntry.inode)
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scandir_recursive(entry.path)
+        yield entry
 
 
 def remove_apple_system_files(
@@ -771,228 +914,418 @@ def remove_apple_system_files(
     files_removed, dirs_removed = 0, 0
 
     try:
-        for path in sorted(
-            directory.glob("**/*"), key=lambda p: len(p.parts), reverse=True
-        ):
+        # Post-order walk: deepest entries are handled before their parents
+        for entry in _scandir_recursive(directory):
+            path = entry.path
             try:
-                if not path.exists():
-                    continue
-
                 # Skip special files and links
-                if path.is_symlink():
-                    if verbosity >= 2:
-                        stats.add_log(f"Skipping symbolic link: {path}", LogLevel.DEBUG)
-                    continue
-
-                if (
-                    path.is_socket()
-                    or path.is_fifo()
-                    or path.is_char_device()
-                    or path.is_block_device()
-                ):
+                if entry.is_symlink():
                     if verbosity >= 2:
-                        stats.add_log(f"Skipping special file: {path}", LogLevel.DEBUG)
+                        stats.add_log(
+                            "Skipping symbolic link: %s", path, level=LogLevel.DEBUG
+                        )
                     continue
 
-                if path.is_dir() and path.name in APPLE_SYSTEM_DIRS:
-                    try:
-                        shutil.rmtree(path)
-                        dirs_removed += 1
-                        stats.add_removed_file_detail(str(path))
-                        stats.add_log(f"Removed Apple directory: {path}", LogLevel.INFO)
-                    except OSError as e:
-                        stats.add_log(f"Error removing {path}: {e}", LogLevel.ERROR)
-
-                elif path.is_file() and is_apple_system_file(path.name):
-                    try:
-                        path.unlink()
-                        files_removed += 1
-                        stats.add_removed_file_detail(str(path))
-                        stats.add_log(f"Removed Apple file: {path}", LogLevel.INFO)
-                    except OSError as e:
-                        stats.add_log(f"Error removing {path}: {e}", LogLevel.ERROR)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in APPLE_SYSTEM_DIRS:
+                        try:
+                            _rmtree_inode_sorted(path)
+                            dirs_removed += 1
+                            stats.add_removed_file_detail(path)
+                            stats.add_log(
+                                "Removed Apple directory: %s", path, level=LogLevel.INFO
+                            )
+                        except OSError as e:
+                            stats.add_log(
+                                "Error removing %s: %s", path, e, level=LogLevel.ERROR
+                            )
+
+                elif entry.is_file(follow_symlinks=False):
+                    if is_apple_system_file(entry.name):
+                        try:
+                            os.unlink(path)
+                            files_removed += 1
+                            stats.add_removed_file_detail(path)
+                            stats.add_log(
+                                "Removed Apple file: %s", path, level=LogLevel.INFO
+                            )
+                        except OSError as e:
+                            stats.add_log(
+                                "Error removing %s: %s", path, e, level=LogLevel.ERROR
+                            )
+
+                # Sockets, FIFOs and devices
+                elif verbosity >= 2:
+                    stats.add_log(
+                        "Skipping special file: %s", path, level=LogLevel.DEBUG
+                    )
 
             except OSError as e:
-                stats.add_log(f"Error processing {path}: {e}", LogLevel.ERROR)
+                stats.add_log("Error processing %s: %s", path, e, level=LogLevel.ERROR)
 
     except Exception as e:
-        stats.add_log(f"Unexpected error during cleanup: {e}", LogLevel.ERROR)
+        stats.add_log("Unexpected error during cleanup: %s", e, level=LogLevel.ERROR)
 
     return files_removed, dirs_removed
 
 
-def extract_zip_files(
-    source_dir: Path,
-    stats: OperationStats,
-    no_confirm: bool = False,
-    verbosity: int = DEFAULT_VERBOSITY,
-) -> None:
-    """Extract all ZIP files in the directory to corresponding subdirectories.
+def _prepare_zip_extraction(
+    zip_file: Path, dest_dir: Path, stats: OperationStats, no_confirm: bool = False
+) -> bool:
+    """Run the checks and confirmation prompts for one ZIP file.
 
-    For each ZIP file found:
-    1. Creates a subdirectory with the ZIP's basename
-    2. Extracts contents into the subdirectory
-    3. Removes Apple system files from extracted contents
-    4. Deletes the original ZIP if extraction succeeds
+    Runs in the main thread, so that every question is asked before any
+    extraction starts. On success the destination directory exists and is
+    empty.
 
     Args:
-        source_dir: Directory containing ZIP files
+        zip_file: ZIP file to extract
+        dest_dir: Directory the ZIP will be extracted into
         stats: OperationStats instance for logging
         no_confirm: Skip confirmation prompts if True
-        verbosity: Controls output detail (0-2)
 
-    Examples:
-        >>> my_stats = OperationStats()
-        >>> extract_zip_files(Path("/tmp/zips"), my_stats, no_confirm=True)
+    Returns:
+        True if the ZIP file should be extracted, False if it was skipped
     """
-    for i, zip_file in enumerate(source_dir.glob("*.zip")):
-        stats.total_zips += 1
-        dest_dir = source_dir / zip_file.stem
+    stats.add_log("Processing ZIP: %s", zip_file.name, level=LogLevel.OPERATION)
+    stats.add_log("Creating directory: %s", dest_dir, level=LogLevel.INFO)
 
-        stats.add_log(f"Processing ZIP: {zip_file.name}", LogLevel.OPERATION)
-        stats.add_log(f"Creating directory: {dest_dir}", LogLevel.INFO)
+    # Check for path length issues (Windows)
+    if is_path_too_long(dest_dir, stats):
+        stats.add_log("Path too long for Windows: %s", dest_dir, level=LogLevel.ERROR)
+        stats.failed_extractions += 1
+        return False
 
-        # Check for path length issues (Windows)
-        if is_path_too_long(dest_dir, stats):
-            stats.add_log(f"Path too long for Windows: {dest_dir}", LogLevel.ERROR)
+    # Check ZIP file size
+    try:
+        zip_size = zip_file.stat().st_size
+        if zip_size > MAX_ZIP_SIZE:
+            stats.add_log(
+                "ZIP file too large (%.2f MB): %s",
+                zip_size / 1024 / 1024,
+                zip_file,
+                level=LogLevel.WARNING,
+            )
+            if not no_confirm and not get_user_confirmation(
+                "Proceed with large file?", default=False, stats=stats
+            ):
+                stats.add_log("Skipped large ZIP file", level=LogLevel.INFO)
+                stats.failed_extractions += 1
+                return False
+    except OSError as e:
+        stats.add_log("Error checking ZIP size: %s", e, level=LogLevel.ERROR)
+        stats.failed_extractions += 1
+        return False
+
+    # Check if the destination exists
+    if dest_dir.exists():
+        stats.add_log("Destination directory exists", level=LogLevel.WARNING)
+        if not no_confirm and not get_user_confirmation(
+            "Overwrite contents?", default=False, stats=stats
+        ):
+            stats.add_log("Skipped by user", level=LogLevel.INFO)
             stats.failed_extractions += 1
-            continue
+            return False
 
-        # Check ZIP file size
         try:
-            zip_size = zip_file.stat().st_size
-            if zip_size > MAX_ZIP_SIZE:
+            _rmtree_inode_sorted(dest_dir)
+            stats.add_log("Cleared existing directory", level=LogLevel.OPERATION)
+        except OSError as e:
+            stats.add_log("Clear failed: %s", e, level=LogLevel.ERROR)
+            stats.failed_extractions += 1
+            return False
+
+    # Create the destination directory
+    try:
+        dest_dir.mkdir(exist_ok=True)
+    except OSError as e:
+        stats.add_log("Failed to create directory: %s", e, level=LogLevel.ERROR)
+        stats.failed_extractions += 1
+        return False
+
+    # Check the ZIP directory (no decompression needed)
+    try:
+        with zipfile.ZipFile(zip_file, "r") as zip_ref:
+            # Check for encrypted files
+            if any(f.flag_bits & 0x1 for f in zip_ref.infolist()):
                 stats.add_log(
-                    f"ZIP file too large ({zip_size/1024/1024:.2f} MB): {zip_file}",
-                    LogLevel.WARNING,
+                    "Password-protected ZIP detected: %s",
+                    zip_file,
+                    level=LogLevel.WARNING,
                 )
                 if not no_confirm and not get_user_confirmation(
-                    "Proceed with large file?", default=False, stats=stats
+                    "Attempt extraction without password?",
+                    default=False,
+                    stats=stats,
                 ):
-                    stats.add_log("Skipped large ZIP file", LogLevel.INFO)
+                    stats.add_log("Skipped password-protected ZIP", level=LogLevel.INFO)
                     stats.failed_extractions += 1
-                    continue
-        except OSError as e:
-            stats.add_log(f"Error checking ZIP size: {e}", LogLevel.ERROR)
-            stats.failed_extractions += 1
-            continue
+                    return False
 
-        # Check if the destination exists
-        if dest_dir.exists():
-            stats.add_log("Destination directory exists", LogLevel.WARNING)
-            if not no_confirm and not get_user_confirmation(
-                "Overwrite contents?", default=False, stats=stats
-            ):
-                stats.add_log("Skipped by user", LogLevel.INFO)
+            # Check for unsafe paths
+            for info in zip_ref.infolist():
+                if os.path.isabs(info.filename) or "../" in info.filename:
+                    stats.add_log(
+                        "ZIP contains unsafe paths: %s",
+                        info.filename,
+                        level=LogLevel.ERROR,
+                    )
+                    stats.failed_extractions += 1
+                    raise zipfile.BadZipFile("Unsafe path detected")
+
+    except zipfile.BadZipFile as e:
+        stats.add_log("Bad ZIP file: %s", e, level=LogLevel.ERROR)
+        stats.failed_extractions += 1
+        _remove_extraction_dir(dest_dir, stats)
+        return False
+    except Exception as e:
+        stats.add_log("Unexpected error during extraction: %s", e, level=LogLevel.ERROR)
+        stats.failed_extractions += 1
+        _remove_extraction_dir(dest_dir, stats)
+        return False
+
+    return True
+
+
+def _extract_zip(zip_file: Path, dest_dir: Path, verbose: bool) -> OperationStats:
+    """Extract one checked ZIP file without its Apple system files.
+
+    Runs in a worker thread: it only reports through its own OperationStats,
+    which the caller merges into the shared one.
+
+    Args:
+        zip_file: ZIP file accepted by _prepare_zip_extraction()
+        dest_dir: Empty directory to extract into
+        verbose: Keep INFO log entries
+
+    Returns:
+        Statistics and logs of this extraction
+    """
+    stats = OperationStats(verbose=verbose)
+
+    try:
+        with zipfile.ZipFile(zip_file, "r") as zip_ref:
+            # Check for corrupted files
+            corrupted = zip_ref.testzip()
+            if corrupted:
+                stats.add_log(
+                    "Corrupted file in ZIP: %s", corrupted, level=LogLevel.ERROR
+                )
                 stats.failed_extractions += 1
-                continue
+                return stats
+
+            # Perform extraction, leaving out Apple system files
+            files_removed, dirs_removed = _extract_members(zip_ref, dest_dir, stats)
+            stats.files_removed += files_removed
+            stats.dirs_removed += dirs_removed
 
+        # Check if extraction produced any content
+        if not _is_empty_dir(dest_dir):
             try:
-                shutil.rmtree(dest_dir)
-                stats.add_log("Cleared existing directory", LogLevel.OPERATION)
+                zip_file.unlink()
+                stats.successful_extractions += 1
+                stats.add_log("Extraction successful", level=LogLevel.SUCCESS)
             except OSError as e:
-                stats.add_log(f"Clear failed: {e}", LogLevel.ERROR)
+                stats.add_log("Failed to remove ZIP: %s", e, level=LogLevel.ERROR)
                 stats.failed_extractions += 1
-                continue
-
-        # Create the destination directory
-        try:
-            dest_dir.mkdir(exist_ok=True)
-        except OSError as e:
-            stats.add_log(f"Failed to create directory: {e}", LogLevel.ERROR)
+        else:
+            stats.add_log("Empty ZIP file", level=LogLevel.ERROR)
             stats.failed_extractions += 1
-            continue
 
-        # Extract ZIP contents
-        try:
-            with zipfile.ZipFile(zip_file, "r") as zip_ref:
-                # Check for corrupted files
-                corrupted = zip_ref.testzip()
-                if corrupted:
-                    stats.add_log(f"Corrupted file in ZIP: {corrupted}", LogLevel.ERROR)
-                    stats.failed_extractions += 1
-                    continue
+    except zipfile.BadZipFile as e:
+        stats.add_log("Bad ZIP file: %s", e, level=LogLevel.ERROR)
+        stats.failed_extractions += 1
+        _remove_extraction_dir(dest_dir, stats)
+    except Exception as e:
+        stats.add_log("Unexpected error during extraction: %s", e, level=LogLevel.ERROR)
+        stats.failed_extractions += 1
+        _remove_extraction_dir(dest_dir, stats)
 
-                # Check for encrypted files
-                if any(f.flag_bits & 0x1 for f in zip_ref.infolist()):
-                    stats.add_log(
-                        f"Password-protected ZIP detected: {zip_file}",
-                        LogLevel.WARNING,
-                    )
-                    if not no_confirm and not get_user_confirmation(
-                        "Attempt extraction without password?",
-                        default=False,
-                        stats=stats,
-                    ):
-                        stats.add_log("Skipped password-protected ZIP", LogLevel.INFO)
-                        stats.failed_extractions += 1
-                        continue
-
-                # Check for unsafe paths
-                for info in zip_ref.infolist():
-                    if os.path.isabs(info.filename) or "../" in info.filename:
-                        stats.add_log(
-                            f"ZIP contains unsafe paths: {info.filename}",
-                            LogLevel.ERROR,
-                        )
-                        stats.failed_extractions += 1
-                        raise zipfile.BadZipFile("Unsafe path detected")
+    return stats
 
-                # Perform extraction
-                zip_ref.extractall(dest_dir)
 
-            # Clean Apple system files from extracted contents
-            files_removed, dirs_removed = remove_apple_system_files(
-                dest_dir, stats, verbosity
-            )
-            stats.files_removed += files_removed
-            stats.dirs_removed += dirs_removed
+def _extract_members(
+    zip_ref: zipfile.ZipFile, dest_dir: Path, stats: OperationStats
+) -> Tuple[int, int]:
+    """Extract the members of an open ZIP file, except Apple system files.
 
-            # Check if extraction produced any content
-            if any(dest_dir.iterdir()):
-                try:
-                    zip_file.unlink()
-                    stats.successful_extractions += 1
-                    stats.add_log("Extraction successful", LogLevel.SUCCESS)
-                except OSError as e:
-                    stats.add_log(f"Failed to remove ZIP: {e}", LogLevel.ERROR)
-                    stats.failed_extractions += 1
-            else:
-                stats.add_log("Empty ZIP file", LogLevel.ERROR)
-                stats.failed_extractions += 1
+    Apple system files, and anything inside Apple system directories such as
+    __MACOSX, are skipped instead of being written and removed afterwards.
+    Each other file is copied with a buffer sized to the file (up to
+    EXTRACT_BUFFER_SIZE) and empty files are created without opening the
+    member, which is faster than extractall() on archives with many small
+    files. As in extractall(), empty, "." and ".." path components are
+    dropped so nothing is written outside dest_dir.
 
-        except zipfile.BadZipFile as e:
-            stats.add_log(f"Bad ZIP file: {e}", LogLevel.ERROR)
-            stats.failed_extractions += 1
-            try:
-                shutil.rmtree(dest_dir)
-            except OSError as e:
-                stats.add_log(
-                    f"Failed to remove directory {dest_dir}: {e}", LogLevel.WARNING
+    Args:
+        zip_ref: Open ZIP file, already checked for unsafe paths
+        dest_dir: Directory to extract into
+        stats: OperationStats instance for logging
+
+    Returns:
+        Tuple of (files_skipped, dirs_skipped) Apple system entry counts,
+        counted like remove_apple_system_files() would have removed them
+
+    Raises:
+        OSError: If a file or directory cannot be written
+        zipfile.BadZipFile: If a member fails its CRC check
+    """
+    # Directories already created, to skip repeated mkdir calls
+    created_dirs = {str(dest_dir)}
+    skipped_dirs: set[str] = set()
+    files_skipped = 0
+
+    for info in zip_ref.infolist():
+        parts = [
+            part for part in info.filename.split("/") if part not in ("", ".", "..")
+        ]
+        if not parts:
+            continue
+
+        is_dir = info.is_dir()
+        dir_parts = parts if is_dir else parts[:-1]
+        in_apple_dir = not APPLE_SYSTEM_DIRS.isdisjoint(dir_parts)
+        is_apple_file = not is_dir and is_apple_system_file(parts[-1])
+        if in_apple_dir or is_apple_file:
+            if in_apple_dir:
+                depth = next(
+                    index
+                    for index, part in enumerate(dir_parts)
+                    if part in APPLE_SYSTEM_DIRS
                 )
-        except Exception as e:
-            stats.add_log(f"Unexpected error during extraction: {e}", LogLevel.ERROR)
-            stats.failed_extractions += 1
-            try:
-                shutil.rmtree(dest_dir)
-            except OSError as e:
+                skipped_dirs.add("/".join(parts[: depth + 1]))
+            if is_apple_file:
+                files_skipped += 1
                 stats.add_log(
-                    f"Failed to remove directory {dest_dir}: {e}", LogLevel.WARNING
+                    "Skipped Apple file: %s", info.filename, level=LogLevel.INFO
+                )
+            continue
+
+        target = os.path.join(dest_dir, *parts)
+
+        if is_dir:
+            if target not in created_dirs:
+                os.makedirs(target, exist_ok=True)
+                created_dirs.add(target)
+            continue
+
+        parent = os.path.dirname(target)
+        if parent not in created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            created_dirs.add(parent)
+
+        if info.file_size == 0:
+            open(target, "wb").close()
+            continue
+
+        with zip_ref.open(info) as source, open(target, "wb") as destination:
+            shutil.copyfileobj(
+                source, destination, min(info.file_size, EXTRACT_BUFFER_SIZE)
+            )
+
+    for skipped_dir in sorted(skipped_dirs):
+        stats.add_log("Skipped Apple directory: %s", skipped_dir, level=LogLevel.INFO)
+
+    return files_skipped, len(skipped_dirs)
+
+
+def _remove_extraction_dir(dest_dir: Path, stats: OperationStats) -> None:
+    """Remove the directory of a failed extraction.
+
+    Args:
+        dest_dir: Extraction directory to remove
+        stats: OperationStats instance for logging
+    """
+    try:
+        _rmtree_inode_sorted(dest_dir)
+    except OSError as e:
+        stats.add_log(
+            "Failed to remove directory %s: %s", dest_dir, e, level=LogLevel.WARNING
+        )
+
+
+def extract_zip_files(
+    source_dir: Path,
+    stats: OperationStats,
+    no_confirm: bool = False,
+    verbosity: int = DEFAULT_VERBOSITY,
+) -> None:
+    """Extract all ZIP files in the directory to corresponding subdirectories.
+
+    For each ZIP file found:
+    1. Creates a subdirectory with the ZIP's basename
+    2. Extracts contents into the subdirectory
+    3. Skips Apple system files and directories while extracting
+    4. Deletes the original ZIP if extraction succeeds
+
+    All checks and confirmation prompts run first, then the accepted ZIP
+    files are extracted in parallel threads (zlib releases the GIL while
+    decompressing). Logs are merged back in ZIP order.
+
+    Args:
+        source_dir: Directory containing ZIP files
+        stats: OperationStats instance for logging
+        no_confirm: Skip confirmation prompts if True
+        verbosity: Controls output detail (0-2)
+
+    Examples:
+        >>> my_stats = OperationStats()
+        >>> extract_zip_files(Path("/tmp/zips"), my_stats, no_confirm=True)
+    """
+    # Ask every question before dispatching: one (ZIP file, destination,
+    # preparation stats, accepted) entry per ZIP file
+    prepared: List[Tuple[Path, Path, OperationStats, bool]] = []
+    for zip_file in source_dir.glob("*.zip"):
+        stats.total_zips += 1
+        dest_dir = source_dir / zip_file.stem
+
+        zip_stats = OperationStats(verbose=stats.verbose)
+        accepted = _prepare_zip_extraction(zip_file, dest_dir, zip_stats, no_confirm)
+        prepared.append((zip_file, dest_dir, zip_stats, accepted))
+
+    # One (preparation stats, extraction future or None) pair per ZIP file
+    jobs: List[Tuple[OperationStats, Optional[Future]]] = []
+
+    with ThreadPoolExecutor(max_workers=MAX_EXTRACTION_WORKERS) as executor:
+        for zip_file, dest_dir, zip_stats, accepted in prepared:
+            future = None
+            if accepted:
+                future = executor.submit(
+                    _extract_zip, zip_file, dest_dir, stats.verbose
                 )
+            jobs.append((zip_stats, future))
+
+        for zip_stats, future in jobs:
+            stats.merge(zip_stats)
+            if future is not None:
+                stats.merge(future.result())
 
 
 def find_single_child_dirs(root_dir: Path) -> Generator[Tuple[Path, Path], None, None]:
-    """Find directories containing exactly one subdirectory and no other items."""
-    for parent_dir in root_dir.iterdir():
-        if parent_dir.is_dir():
-            try:
-                children = list(parent_dir.iterdir())
-                dir_children = [c for c in children if c.is_dir()]
+    """Find directories containing exactly one subdirectory and no other items.
 
-                if len(dir_children) == 1 and len(children) == 1:
-                    yield parent_dir, dir_children[0]
-            except OSError as e:
-                continue
+    Each directory is listed with scandir() until its second entry at most,
+    and symbolic links are neither followed nor moved.
+    """
+    # List root_dir up front: the caller moves directories into it
+    with os.scandir(root_dir) as entries:
+        parent_dirs = [
+            Path(entry.path) for entry in entries if entry.is_dir(follow_symlinks=False)
+        ]
+
+    for parent_dir in parent_dirs:
+        try:
+            with os.scandir(parent_dir) as children:
+                first = next(children, None)
+                if first is None or next(children, None) is not None:
+                    continue
+                is_single_dir = first.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+
+        # Yield once the listing is closed, the caller removes parent_dir
+        if is_single_dir:
+            yield parent_dir, Path(first.path)
 
 
 def reorganize_directories(
@@ -1019,7 +1352,7 @@ def reorganize_directories(
     """
     for parent_dir, child_dir in find_single_child_dirs(source_dir):
         stats.dirs_examined += 1
-        stats.add_log(f"Processing: {parent_dir.name}", LogLevel.OPERATION)
+        stats.add_log("Processing: %s", parent_dir.name, level=LogLevel.OPERATION)
 
         # Clean Apple system files before reorganization
         files_removed, dirs_removed = remove_apple_system_files(
@@ -1032,48 +1365,61 @@ def reorganize_directories(
 
         # Check for path length issues (Windows)
         if is_path_too_long(target_path, stats):
-            stats.add_log(f"Path too long for Windows: {target_path}", LogLevel.ERROR)
+            stats.add_log(
+                "Path too long for Windows: %s", target_path, level=LogLevel.ERROR
+            )
             stats.dirs_ignored += 1
             continue
 
         if target_path.exists() and target_path != child_dir:
-            stats.add_log(f"Target exists: {target_path}", LogLevel.WARNING)
+            stats.add_log("Target exists: %s", target_path, level=LogLevel.WARNING)
             if not no_confirm and not get_user_confirmation(
                 "Overwrite target?", default=False, stats=stats
             ):
-                stats.add_log("Skipped by user", LogLevel.INFO)
+                stats.add_log("Skipped by user", level=LogLevel.INFO)
                 stats.dirs_ignored += 1
                 continue
 
-            stats.add_log(f"Removing directory: '{target_path}'...", LogLevel.INFO)
+            stats.add_log(
+                "Removing directory: '%s'...", target_path, level=LogLevel.INFO
+            )
             try:
-                shutil.rmtree(target_path)
+                _rmtree_inode_sorted(target_path)
             except OSError as e:
-                stats.add_log(f"Clear failed: {e}", LogLevel.ERROR)
+                stats.add_log("Clear failed: %s", e, level=LogLevel.ERROR)
                 stats.dirs_ignored += 1
                 continue
 
         stats.add_log(
-            f"Moving directory: '{child_dir.name}' to parent...", LogLevel.INFO
+            "Moving directory: '%s' to parent...", child_dir.name, level=LogLevel.INFO
         )
         try:
-            shutil.move(str(child_dir), str(source_dir))
+            try:
+                # The child is inside source_dir, so a rename is all it takes
+                os.replace(child_dir, target_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Different file system (e.g. a mount point), copy instead
+                shutil.move(str(child_dir), str(source_dir))
         except (OSError, shutil.Error) as e:
-            stats.add_log(f"Failed to move directory: {e}", LogLevel.ERROR)
+            stats.add_log("Failed to move directory: %s", e, level=LogLevel.ERROR)
             stats.dirs_ignored += 1
             continue
 
         try:
             # Check if the parent is now empty
-            if not any(parent_dir.iterdir()):
-                parent_dir.rmdir()
+            if _is_empty_dir(parent_dir):
+                os.rmdir(parent_dir)
                 stats.dirs_reorganized += 1
-                stats.add_log("Reorganization successful", LogLevel.SUCCESS)
+                stats.add_log("Reorganization successful", level=LogLevel.SUCCESS)
             else:
-                stats.add_log("Parent not empty after move", LogLevel.WARNING)
+                stats.add_log("Parent not empty after move", level=LogLevel.WARNING)
                 stats.dirs_ignored += 1
         except OSError as e:
-            stats.add_log(f"Failed to remove parent directory: {e}", LogLevel.ERROR)
+            stats.add_log(
+                "Failed to remove parent directory: %s", e, level=LogLevel.ERROR
+            )
             stats.dirs_ignored += 1
 
 
@@ -1100,7 +1446,8 @@ def get_user_confirmation(
     if not sys.stdin.isatty():
         if stats:
             stats.add_log(
-                "No interactive terminal, using default response", LogLevel.WARNING
+                "No interactive terminal, using default response",
+                level=LogLevel.WARNING,
             )
         return default
 
@@ -1181,57 +1528,65 @@ def main() -> Literal[0, 1]:
         print(f"Error resolving directory path: {e}", file=sys.stderr)
         return 1
 
-    stats = OperationStats()
+    stats = OperationStats(verbose=args.verbosity >= 2)
 
     # Notify about optional dependencies
     if not HAS_COLORAMA and not args.no_color:
         stats.add_log(
             "Note: For colored output, install 'colorama' with: `pip install colorama`",
-            LogLevel.INFO,
+            level=LogLevel.INFO,
         )
     if not HAS_RICH:
         stats.add_log(
             "Note: For better output formatting, install 'rich' with: `pip install rich`",
-            LogLevel.INFO,
+            level=LogLevel.INFO,
         )
         if not HAS_TABULATE:
             stats.add_log(
                 "Note: For better output formatting, install 'tabulate' with: `pip install tabulate`",
-                LogLevel.INFO,
+                level=LogLevel.INFO,
             )
 
     # Validate directory
     if not args.directory.exists():
-        stats.add_log(f"Directory not found: {args.directory}", LogLevel.ERROR)
+        stats.add_log("Directory not found: %s", args.directory, level=LogLevel.ERROR)
         stats.print_logs(verbosity=1)
         return 1
 
     if not args.directory.is_dir():
-        stats.add_log(f"Path is not a directory: {args.directory}", LogLevel.ERROR)
+        stats.add_log(
+            "Path is not a directory: %s", args.directory, level=LogLevel.ERROR
+        )
         stats.print_logs(verbosity=1)
         return 1
 
     if not check_readable(args.directory, stats):
         stats.add_log(
-            f"No read permission for directory: {args.directory}", LogLevel.ERROR
+            "No read permission for directory: %s", args.directory, level=LogLevel.ERROR
         )
         stats.print_logs(verbosity=1)
         return 1
 
     if not check_writable(args.directory, stats):
         stats.add_log(
-            f"No write permission for directory: {args.directory}", LogLevel.ERROR
+            "No write permission for directory: %s",
+            args.directory,
+            level=LogLevel.ERROR,
         )
         stats.print_logs(verbosity=1)
         return 1
 
     if is_network_path(args.directory, stats):
-        stats.add_log("Network path detected - operations may be slower", LogLevel.INFO)
+        stats.add_log(
+            "Network path detected - operations may be slower", level=LogLevel.INFO
+        )
 
     # Acquire directory lock
     lock_fd = acquire_lock(args.directory)
     if lock_fd is None and not args.no_confirm:
-        stats.add_log("Warning: Could not acquire directory lock", LogLevel.WARNING)
+        stats.add_log(
+            "Warning: Could not acquire directory lock", level=LogLevel.WARNING
+        )
         if not get_user_confirmation(
             "Continue without lock?", default=False, stats=stats
         ):
@@ -1241,7 +1596,7 @@ def main() -> Literal[0, 1]:
         # Execute requested operations
         if args.clean_only:
             stats.add_log(
-                f"Starting clean-only mode in {args.directory}", LogLevel.INFO
+                "Starting clean-only mode in %s", args.directory, level=LogLevel.INFO
             )
             files, dirs = remove_apple_system_files(
                 args.directory, stats, args.verbosity
@@ -1250,7 +1605,7 @@ def main() -> Literal[0, 1]:
             stats.dirs_removed = dirs
         else:
             stats.add_log(
-                f"Starting full processing in {args.directory}", LogLevel.INFO
+                "Starting full processing in %s", args.directory, level=LogLevel.INFO
             )
             extract_zip_files(args.directory, stats, args.no_confirm, args.verbosity)
             files, dirs = remove_apple_system_files(
@@ -1269,11 +1624,11 @@ def main() -> Literal[0, 1]:
         return 0 if stats.errors == 0 else 1
 
     except Exception as e:
-        stats.add_log(f"Unexpected error: {e}", LogLevel.ERROR)
+        stats.add_log("Unexpected error: %s", e, level=LogLevel.ERROR)
         if args.verbosity >= 1:
             import traceback
 
-            stats.add_log(traceback.format_exc(), LogLevel.DEBUG)
+            stats.add_log(traceback.format_exc(), level=LogLevel.DEBUG)
         stats.print_logs(verbosity=args.verbosity)
         return 1
 